@@ -1,17 +1,29 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from django.contrib.auth import authenticate
-from django.contrib.auth.models import User
 from django.contrib.auth.hashers import make_password
-from django.db.models import Count
-from django.db import transaction
+from django.contrib.auth.models import User
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import CharField, Count, F, Max, Q, Sum, Value
+from django.db import connection, transaction
 from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from django.utils.dateparse import parse_datetime
 from django.http import Http404
 from django.conf import settings
+from django.core.cache import cache
 from semanticscholar import SemanticScholar
+from semanticscholar.SemanticScholarException import (
+    GatewayTimeoutException,
+    InternalServerErrorException,
+    ServerErrorException,
+)
 
 # IMPORT MODELS 
 from .models import Claim, Source, Dispute, VerificationResult, ClaimSource
@@ -19,36 +31,185 @@ from .permissions import IsAdminOrReadOnly, IsSuperAdminOnly
 from .serializers import DisputeDetailSerializer, DisputeReviewSerializer
 from .email_service import email_service
 from .ai_adapter import call_ai_verify, normalize_ai_response
-
+from .signals import (
+    DASHBOARD_STATS_CACHE_KEY,
+    DASHBOARD_STATS_CACHE_TIMEOUT,
+    SOURCE_STATS_CACHE_KEY,
+    SOURCE_STATS_CACHE_TIMEOUT,
+    SOURCE_TABLE_ETAG_CACHE_KEY,
+)
+from .tasks import (
+    JOB_DONE, JOB_FAILED, JOB_QUEUED, JOB_RUNNING,
+    create_job, enqueue_on_commit, get_job, run_in_background, update_job
+)
+
+import codecs
+import hashlib
+import httpx
 import logging
+import random
+import re
+import time
+import orjson
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session (keep-alive + retry) untuk CrossRef & scraping URL
+_HTTP = requests.Session()
+_HTTP.headers.update({'User-Agent': 'Healthify/1.0 (mailto:admin@healthify.cloud)'})
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        raise_on_status=False
+    )
+)
+_HTTP.mount('https://', _HTTP_ADAPTER)
+_HTTP.mount('http://', _HTTP_ADAPTER)
+
+# Hot path CrossRef: urllib3 langsung (tanpa overhead requests per call)
+_CROSSREF_POOL = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=20,
+    headers={'User-Agent': 'Healthify/1.0 (mailto:admin@healthify.cloud)'},
+    timeout=urllib3.Timeout(connect=3, read=10),
+    retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        raise_on_status=False
+    )
+)
+
+# Pre-compiled patterns untuk parsing evidence (CrossRef abstract & HTML)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_TITLE_RE = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+_META_DESC_RE = re.compile(
+    r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)["\']',
+    re.IGNORECASE
+)
+_HEAD_END_RE = re.compile(r'</head>', re.IGNORECASE)
+
+# Batas pembacaan HTML saat scraping URL evidence
+_URL_SCAN_LIMIT = 64 * 1024
+_URL_CHUNK_SIZE = 8 * 1024
+# Overlap antar chunk; tag <title>/<meta> jauh lebih pendek dari ini
+_URL_SCAN_OVERLAP = 1024
+
+# Cache hasil lookup evidence (metadata DOI praktis tidak berubah)
+EVIDENCE_DOI_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+EVIDENCE_URL_CACHE_TIMEOUT = 60 * 60 * 24
+# Lock agar refresh stale evidence hanya dijadwalkan sekali per key
+EVIDENCE_REFRESH_LOCK_TIMEOUT = 60
+
+
+# Batas panjang ringkasan: disimpan ke DB dan ditampilkan di response review
+SUMMARY_MAX_LENGTH = 1000
+SUMMARY_PREVIEW_LENGTH = 200
+
+
+# Error Semantic Scholar yang layak di-retry (library me-raise ConnectionRefusedError untuk 429;
+# transport-nya httpx, bukan requests). Retry bawaan library dimatikan lewat retry=False
+# supaya tidak bertumpuk dengan loop retry di _fetch_similar_journals.
+_SEMANTIC_SCHOLAR_RETRYABLE = (
+    ConnectionRefusedError,
+    GatewayTimeoutException,
+    InternalServerErrorException,
+    ServerErrorException,
+    httpx.TimeoutException,
+    httpx.ConnectError,
+)
+
+# Client Semantic Scholar dipakai bersama. Library membuka httpx.AsyncClient baru
+# per request (tanpa state koneksi), jadi aman dipakai lintas thread.
+_SEMANTIC_SCHOLAR = SemanticScholar(timeout=10, retry=False)
+
+
+def _get_verification_or_new(claim: Claim) -> VerificationResult:
+    """VerificationResult klaim (dari select_related) atau instance baru yang belum disimpan."""
+    try:
+        return claim.verification_result
+    except VerificationResult.DoesNotExist:
+        return VerificationResult(claim=claim)
 
-def fetch_evidence_from_doi(doi: str) -> Dict[str, Any]:
+
+def _summary_preview(summary: Optional[str], limit: int = SUMMARY_PREVIEW_LENGTH) -> Optional[str]:
+    """Potong ringkasan untuk response (satu slice, tanpa salinan jika sudah pendek)."""
+    if not summary or len(summary) <= limit:
+        return summary
+    return summary[:limit] + '...'
+
+
+def _write_verification(verification: VerificationResult, updates: Dict[str, Any]) -> VerificationResult:
+    """Terapkan semua perubahan lalu tulis sekali (UPDATE kolom yang berubah, atau INSERT)."""
+    for field, value in updates.items():
+        setattr(verification, field, value)
+    if verification.pk:
+        verification.save(update_fields=[*updates, 'updated_at'])
+    else:
+        verification.save()
+    return verification
+
+
+def _evidence_cache_key(kind: str, value: str) -> str:
+    """Cache key aman (tanpa spasi/karakter khusus) untuk DOI atau URL."""
+    digest = hashlib.md5(value.encode('utf-8')).hexdigest()
+    return f"evidence:{kind}:{digest}"
+
+
+def _store_evidence(cache_key: str, payload: Dict[str, Any], ttl: int):
+    """Simpan (fresh_until, payload); entry tetap ada selama ttl tambahan sebagai data stale."""
+    cache.set(cache_key, (time.time() + ttl, payload), ttl * 2)
+
+
+def _refresh_evidence(cache_key: str, loader, ttl: int):
+    """Task background: ambil ulang evidence yang sudah stale."""
+    try:
+        payload = loader()
+        if payload is not None:
+            _store_evidence(cache_key, payload, ttl)
+    finally:
+        cache.delete(f"{cache_key}:refresh")
+
+
+def _get_cached_evidence(kind: str, key_value: str, loader, ttl: int) -> Optional[Dict[str, Any]]:
     """
-    Fetch metadata dan abstract dari DOI menggunakan CrossRef API.
+    Cache evidence dengan stale-while-revalidate:
+    - fresh  -> langsung dari cache
+    - stale  -> kembalikan data lama, refresh di background (sekali per key)
+    - miss   -> panggil loader; hasil None (gagal) tidak di-cache
     """
-    if not doi:
-        return {}
-    
-    # Clean DOI
-    doi = doi.strip()
-    if doi.startswith('https://doi.org/'):
-        doi = doi.replace('https://doi.org/', '')
-    elif doi.startswith('http://doi.org/'):
-        doi = doi.replace('http://doi.org/', '')
-    
+    cache_key = _evidence_cache_key(kind, key_value)
+    entry = cache.get(cache_key)
+    if entry is not None:
+        fresh_until, payload = entry
+        if time.time() >= fresh_until and cache.add(f"{cache_key}:refresh", 1, EVIDENCE_REFRESH_LOCK_TIMEOUT):
+            run_in_background(_refresh_evidence, cache_key, loader, ttl)
+        return payload
+
+    payload = loader()
+    if payload is not None:
+        _store_evidence(cache_key, payload, ttl)
+    return payload
+
+
+def _lookup_crossref(doi: str) -> Optional[Dict[str, Any]]:
+    """Panggil CrossRef API; None jika gagal."""
     try:
         # CrossRef API
         url = f"https://api.crossref.org/works/{doi}"
-        headers = {'User-Agent': 'Healthify/1.0 (mailto:admin@healthify.cloud)'}
         
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _CROSSREF_POOL.request('GET', url)
         
-        if response.status_code == 200:
-            data = response.json()
+        if response.status == 200:
+            data = orjson.loads(response.data)
             work = data.get('message', {})
             
             # Extract title
@@ -59,8 +220,7 @@ def fetch_evidence_from_doi(doi: str) -> Dict[str, Any]:
             abstract = work.get('abstract', '')
             if abstract:
                 # Clean HTML tags dari abstract
-                import re
-                abstract = re.sub(r'<[^>]+>', '', abstract)
+                abstract = _HTML_TAG_RE.sub('', abstract)
             
             # Extract authors
             authors = []
@@ -80,45 +240,103 @@ def fetch_evidence_from_doi(doi: str) -> Dict[str, Any]:
                 'url': f"https://doi.org/{doi}"
             }
         else:
-            logger.warning(f"[FETCH_DOI] CrossRef returned {response.status_code} for DOI: {doi}")
+            logger.warning(f"[FETCH_DOI] CrossRef returned {response.status} for DOI: {doi}")
             
     except Exception as e:
         logger.error(f"[FETCH_DOI] Error fetching DOI {doi}: {e}")
     
-    return {'doi': doi, 'url': f"https://doi.org/{doi}"}
+    return None
 
 
-def fetch_evidence_from_url(url: str) -> Dict[str, Any]:
+def fetch_evidence_from_doi(doi: str) -> Dict[str, Any]:
     """
-    Fetch content dari URL (basic scraping untuk title).
+    Fetch metadata dan abstract dari DOI menggunakan CrossRef API.
     """
-    if not url:
+    if not doi:
         return {}
     
+    # Clean DOI
+    doi = doi.strip()
+    if doi.startswith('https://doi.org/'):
+        doi = doi.replace('https://doi.org/', '')
+    elif doi.startswith('http://doi.org/'):
+        doi = doi.replace('http://doi.org/', '')
+
+    # DOI case-insensitive, jadi normalisasi ke lowercase untuk cache key
+    result = _get_cached_evidence(
+        'doi', doi.lower(), lambda: _lookup_crossref(doi), EVIDENCE_DOI_CACHE_TIMEOUT
+    )
+    return result or {'doi': doi, 'url': f"https://doi.org/{doi}"}
+
+
+def _scrape_url(url: str) -> Optional[Dict[str, Any]]:
+    """Ambil title + meta description dari halaman; None jika gagal."""
     try:
         headers = {'User-Agent': 'Mozilla/5.0 (compatible; Healthify/1.0)'}
-        response = requests.get(url, headers=headers, timeout=10)
-        
-        if response.status_code == 200:
-            # Basic title extraction
-            import re
-            title_match = re.search(r'<title[^>]*>([^<]+)</title>', response.text, re.IGNORECASE)
-            title = title_match.group(1).strip() if title_match else url
-            
-            # Try to find meta description
-            desc_match = re.search(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)["\']', response.text, re.IGNORECASE)
-            description = desc_match.group(1).strip() if desc_match else ''
-            
-            return {
-                'url': url,
-                'title': title[:200],
-                'abstract': description[:1000] if description else f"Content from: {url}"
-            }
+        with _HTTP.get(url, headers=headers, timeout=10, stream=True) as response:
+            if response.status_code == 200:
+                decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='ignore')
+                html = ''
+                read_bytes = 0
+                title_match = None
+                desc_match = None
+
+                # Tiap chunk hanya di-decode sekali; pencarian dimulai dari akhir scan
+                # sebelumnya dikurangi overlap, untuk tag yang terpotong di batas chunk.
+                for chunk in response.iter_content(chunk_size=_URL_CHUNK_SIZE):
+                    read_bytes += len(chunk)
+                    scan_from = max(0, len(html) - _URL_SCAN_OVERLAP)
+                    html += decoder.decode(chunk)
+
+                    # Basic title extraction
+                    title_match = title_match or _TITLE_RE.search(html, scan_from)
+                    # Try to find meta description
+                    desc_match = desc_match or _META_DESC_RE.search(html, scan_from)
+
+                    if (title_match and desc_match) or _HEAD_END_RE.search(html, scan_from):
+                        break
+                    if read_bytes >= _URL_SCAN_LIMIT:
+                        break
+
+                title = title_match.group(1).strip() if title_match else url
+                description = desc_match.group(1).strip() if desc_match else ''
+
+                return {
+                    'url': url,
+                    'title': title[:200],
+                    'abstract': description[:1000] if description else f"Content from: {url}"
+                }
             
     except Exception as e:
         logger.error(f"[FETCH_URL] Error fetching URL {url}: {e}")
     
-    return {'url': url, 'title': url}
+    return None
+
+
+def fetch_evidence_from_url(url: str) -> Dict[str, Any]:
+    """
+    Fetch content dari URL (basic scraping untuk title).
+
+    Response dibaca secara streaming dan berhenti begitu <title> dan meta
+    description ditemukan (atau </head> / batas _URL_SCAN_LIMIT tercapai).
+    """
+    if not url:
+        return {}
+
+    url = url.strip()
+    result = _get_cached_evidence('url', url, lambda: _scrape_url(url), EVIDENCE_URL_CACHE_TIMEOUT)
+    return result or {'url': url, 'title': url}
+
+
+def fetch_dispute_evidence(dispute: Dispute) -> Optional[Dict[str, Any]]:
+    """Fetch evidence dari DOI (prioritas) atau URL yang dilampirkan user."""
+    if dispute.supporting_doi:
+        logger.info(f"[EVIDENCE] Fetching evidence from DOI: {dispute.supporting_doi}")
+        return fetch_evidence_from_doi(dispute.supporting_doi)
+    if dispute.supporting_url:
+        logger.info(f"[EVIDENCE] Fetching evidence from URL: {dispute.supporting_url}")
+        return fetch_evidence_from_url(dispute.supporting_url)
+    return None
 
 
 class AdminDashboardStatsView(APIView):
@@ -131,65 +349,97 @@ class AdminDashboardStatsView(APIView):
 
     def get(self, request):
         try:
-            # Total Claims
-            total_claims = Claim.objects.count()
-            
-            # Pending Disputes
-            pending_disputes = Dispute.objects.filter(status='pending').count()
-            
-            # Total Sources
-            total_sources = Source.objects.count()
-            
-            # Verified Claims (yang sudah ada hasil verifikasi)
-            verified_claims = VerificationResult.objects.values('claim').distinct().count()
-            
-            # Recent Activity (8 aktivitas terbaru)
-            recent_claims = Claim.objects.select_related('verification_result').order_by('-created_at')[:5]
-            recent_activity = []
-            
-            for claim in recent_claims:
-                activity_text = f"New claim: {claim.text[:50]}..."
-                if hasattr(claim, 'verification_result'):
-                    activity_text = f"Verified claim ({claim.verification_result.label}): {claim.text[:50]}..."
-                
-                recent_activity.append({
-                    'id': claim.id,
-                    'text': activity_text,
-                    'time': claim.created_at.isoformat(),
-                    'type': 'claim'
-                })
-            
-            # Recent Disputes
-            recent_disputes = Dispute.objects.select_related('claim').order_by('-created_at')[:3]
-            for dispute in recent_disputes:
-                recent_activity.append({
-                    'id': dispute.id,
-                    'text': f"New dispute: {dispute.claim_text[:50]}..." if dispute.claim_text else "New dispute submitted",
-                    'time': dispute.created_at.isoformat(),
-                    'type': 'dispute'
-                })
-            
-            # Sort by time
-            recent_activity.sort(key=lambda x: x['time'], reverse=True)
-            
+            data = cache.get_or_set(
+                DASHBOARD_STATS_CACHE_KEY,
+                self._compute_stats,
+                timeout=DASHBOARD_STATS_CACHE_TIMEOUT
+            )
+
             logger.info(f"[ADMIN_DASHBOARD] Stats fetched by {request.user.username}")
-            
-            return Response({
-                'stats': {
-                    'total_claims': total_claims,
-                    'pending_disputes': pending_disputes,
-                    'total_sources': total_sources,
-                    'verified_claims': verified_claims
-                },
-                'recent_activity': recent_activity[:8]
-            }, status=status.HTTP_200_OK)
-            
+
+            return Response(data, status=status.HTTP_200_OK)
+
         except Exception as e:
             logger.error(f"[ADMIN_DASHBOARD] Error fetching stats: {str(e)}", exc_info=True)
             return Response({
                 'error': 'Failed to fetch dashboard stats'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    def _compute_stats(self) -> Dict[str, Any]:
+        """Hitung statistik dashboard (dipanggil saat cache miss)."""
+        # Total Claims + Verified Claims (yang sudah ada hasil verifikasi)
+        # verification_result adalah OneToOne, jadi Count tidak perlu DISTINCT
+        claim_counts = Claim.objects.aggregate(
+            total=Count('id'),
+            verified=Count('verification_result')
+        )
+        total_claims = claim_counts['total']
+        verified_claims = claim_counts['verified']
+
+        # Pending Disputes
+        pending_disputes = Dispute.objects.aggregate(
+            pending=Count('id', filter=Q(status=Dispute.STATUS_PENDING))
+        )['pending']
+
+        # Total Sources
+        total_sources = Source.objects.count()
+
+        # Recent Activity (8 aktivitas terbaru)
+        # Satu query UNION ALL + ORDER BY + LIMIT, sorting dikerjakan database.
+        # Kolom harus sejajar di kedua sisi UNION; label None = belum diverifikasi.
+        recent_claims = Claim.objects.order_by().values(
+            'id', 'created_at',
+            body=F('text'),
+            label=F('verification_result__label'),
+            atype=Value('claim', output_field=CharField())
+        )
+        recent_disputes = Dispute.objects.order_by().values(
+            'id', 'created_at',
+            body=F('claim_text'),
+            label=Value(None, output_field=CharField()),
+            atype=Value('dispute', output_field=CharField())
+        )
+        recent_rows = recent_claims.union(recent_disputes, all=True).order_by('-created_at')[:8]
+
+        recent_activity = [{
+            'id': row['id'],
+            'text': self._activity_text(row),
+            'time': row['created_at'],
+            'type': row['atype']
+        } for row in recent_rows]
+
+        return {
+            'stats': {
+                'total_claims': total_claims,
+                'pending_disputes': pending_disputes,
+                'total_sources': total_sources,
+                'verified_claims': verified_claims
+            },
+            'recent_activity': recent_activity
+        }
+
+    @staticmethod
+    def _activity_text(row: Dict[str, Any]) -> str:
+        """Teks aktivitas untuk satu baris hasil UNION (claim/dispute)."""
+        body = row['body'] or ''
+        if row['atype'] == 'dispute':
+            return f"New dispute: {body[:50]}..." if body else "New dispute submitted"
+        if row['label'] is None:
+            return f"New claim: {body[:50]}..."
+        return f"Verified claim ({row['label']}): {body[:50]}..."
+
+
+# Kolom admin user yang dikirim di list/detail
+ADMIN_USER_FIELDS = (
+    'id', 'username', 'email', 'is_superuser',
+    'is_staff', 'date_joined', 'last_login'
+)
+
+# Batas batch pembuatan admin & thread hashing password
+ADMIN_BULK_CREATE_MAX = 100
+ADMIN_PASSWORD_HASH_WORKERS = 4
+
+
 class AdminUserListView(APIView):
     """
     GET: Melihat semua admin users
@@ -202,20 +452,12 @@ class AdminUserListView(APIView):
         logger.info(f"[ADMIN_USER_LIST] Request from {request.user.username}")
 
         try:
-            admins = User.objects.filter(is_staff=True).values(
-                'id',
-                'username',
-                'email',
-                'is_superuser',
-                'is_staff',
-                'date_joined',
-                'last_login'
-            )
+            admins = list(User.objects.filter(is_staff=True).values(*ADMIN_USER_FIELDS))
 
             return Response({
                 'status': True,
-                'total': admins.count(),
-                'admins': list(admins)
+                'total': len(admins),
+                'admins': admins
             }, status=status.HTTP_200_OK)
 
         except Exception as e:
@@ -226,9 +468,12 @@ class AdminUserListView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         
     def post(self, request):
-        """Membuat admin user baru"""
+        """Membuat admin user baru (satu object, atau list untuk batch)"""
         logger.info(f"[ADMIN_USER_CREATE] Request from {request.user.username}")
 
+        if isinstance(request.data, list):
+            return self._bulk_create(request)
+
         username = request.data.get('username')
         email = request.data.get('email')
         password = request.data.get('password')
@@ -241,10 +486,10 @@ class AdminUserListView(APIView):
             }, status=status.HTTP_400_BAD_REQUEST)
         
         try:
-            new_admin = User.objects.create(
+            new_admin = User.objects.create_user(
                 username=username,
                 email=email,
-                password=make_password(password),
+                password=password,
                 is_staff=True,
                 is_superuser=is_superuser
             )
@@ -254,12 +499,72 @@ class AdminUserListView(APIView):
             return Response({
                 'status': True,
                 'message': 'Admin user created successfully',
-                'admin': {
-                    'id': new_admin.id,
-                    'username': new_admin.username,
-                    'email': new_admin.email,
-                    'is_superuser': new_admin.is_superuser,
-                }
+                'admin': {field: getattr(new_admin, field) for field in ADMIN_USER_FIELDS}
+            }, status=status.HTTP_201_CREATED)
+
+        except Exception as e:
+            logger.error(f"[ADMIN_USER_CREATE][ERROR] {str(e)}", exc_info=True)
+            return Response({
+                'status': False,
+                'message': 'Terjadi kesalahan saat membuat admin user.'
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    def _bulk_create(self, request):
+        """
+        Batch admin: password di-hash paralel (PBKDF2 hashlib melepas GIL),
+        lalu semua user ditulis dengan satu bulk_create dalam satu transaksi.
+        """
+        payload = request.data
+
+        if not payload or len(payload) > ADMIN_BULK_CREATE_MAX:
+            return Response({
+                'status': False,
+                'message': f'Batch harus berisi 1 sampai {ADMIN_BULK_CREATE_MAX} admin.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        if not all(
+            isinstance(item, dict) and item.get('username') and item.get('email') and item.get('password')
+            for item in payload
+        ):
+            return Response({
+                'status': False,
+                'message': 'Username, email, dan password wajib diisi untuk setiap admin.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        usernames = [item['username'] for item in payload]
+        taken = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+        if taken or len(set(usernames)) != len(usernames):
+            return Response({
+                'status': False,
+                'message': 'Username sudah dipakai atau duplikat dalam batch.',
+                'usernames': sorted(taken)
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with ThreadPoolExecutor(max_workers=ADMIN_PASSWORD_HASH_WORKERS) as executor:
+                hashed = list(executor.map(make_password, (item['password'] for item in payload)))
+
+            with transaction.atomic():
+                created = User.objects.bulk_create([
+                    User(
+                        username=item['username'],
+                        email=User.objects.normalize_email(item['email']),
+                        password=password,
+                        is_staff=True,
+                        is_superuser=bool(item.get('is_superuser', False))
+                    )
+                    for item, password in zip(payload, hashed)
+                ], batch_size=100)
+
+            logger.info(f"[ADMIN_USER_CREATE] {len(created)} admin users created by '{request.user.username}'")
+
+            return Response({
+                'status': True,
+                'message': f'{len(created)} admin users created successfully',
+                'admins': [
+                    {field: getattr(admin, field) for field in ADMIN_USER_FIELDS}
+                    for admin in created
+                ]
             }, status=status.HTTP_201_CREATED)
 
         except Exception as e:
@@ -281,15 +586,7 @@ class AdminUserDetailView(APIView):
         logger.info(f"[ADMIN_USER_DETAIL] request for user {user_id}")
 
         try:
-            admin = User.objects.filter(id=user_id, is_staff=True).values(
-                'id',
-                'username',
-                'email',
-                'is_superuser',
-                'is_staff',
-                'date_joined',
-                'last_login'
-            ).first()
+            admin = User.objects.filter(id=user_id, is_staff=True).values(*ADMIN_USER_FIELDS).first()
 
             if not admin:
                 return Response({
@@ -320,7 +617,8 @@ class AdminUserDetailView(APIView):
             }, status=status.HTTP_400_BAD_REQUEST)
         
         try:
-            admin = User.objects.filter(id=user_id, is_staff=True).first()
+            # Hanya butuh pk + username (untuk log); hindari memuat hash password
+            admin = User.objects.filter(id=user_id, is_staff=True).only('id', 'username').first()
 
             if not admin:
                 return Response({
@@ -345,6 +643,12 @@ class AdminUserDetailView(APIView):
                 'message': 'Terjadi kesalahan saat menghapus admin user.'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+
+# Default & batas page size daftar dispute admin
+DISPUTE_LIST_PAGE_SIZE = 50
+DISPUTE_LIST_MAX_PAGE_SIZE = 200
+
+
 class AdminDisputeListView(APIView):
     """
         GET /api/admin/disputes/
@@ -355,41 +659,54 @@ class AdminDisputeListView(APIView):
     def get(self, request):
         try:
             status_filter = request.query_params.get('status', 'all')
+            page = max(int(request.query_params.get('page', 1)), 1)
+            per_page = min(max(int(request.query_params.get('per_page', DISPUTE_LIST_PAGE_SIZE)), 1), DISPUTE_LIST_MAX_PAGE_SIZE)
 
             disputes = Dispute.objects.all()
 
             if status_filter != 'all':
                 disputes = disputes.filter(status=status_filter)
 
-            disputes = disputes.select_related('claim').order_by('-created_at')
-
-            dispute_list = []
-            for dispute in disputes:
-                dispute_list.append({
-                    'id': dispute.id,
-                    'claim_id': dispute.claim.id if dispute.claim else None,
-                    'claim_text': dispute.claim_text,
-                    'reason': dispute.reason,  
-                    'reporter_name': dispute.reporter_name,
-                    'reporter_email': dispute.reporter_email,
-                    'status': dispute.status,
-                    'status_display': dispute.get_status_display(),
-                    'supporting_doi': dispute.supporting_doi,
-                    'supporting_url': dispute.supporting_url,
-                    'supporting_file': bool(dispute.supporting_file),
-                    'created_at': dispute.created_at.isoformat(),
-                    'reviewed_at': dispute.reviewed_at.isoformat() if dispute.reviewed_at else None,  
-                    'reviewed_by': dispute.reviewed_by.username if dispute.reviewed_by else None,
-                    'review_note': dispute.review_note,  
-                    'original_label': dispute.original_label,
-                    'original_confidence': dispute.original_confidence
-                })
+            # Pagination di level DB (index status + created_at)
+            start = (page - 1) * per_page
+            end = start + per_page
+
+            # values() langsung: tanpa instansiasi model, claim_id tanpa JOIN;
+            # datetime diserialisasi oleh renderer (orjson)
+            rows = disputes.order_by('-created_at').values(
+                'id', 'claim_id', 'claim_text', 'reason',
+                'reporter_name', 'reporter_email', 'status',
+                'supporting_doi', 'supporting_url', 'supporting_file',
+                'created_at', 'reviewed_at', 'review_note',
+                'original_label', 'original_confidence',
+                reviewer_username=F('reviewed_by__username')
+            )[start:end]
+
+            # Lengkapi dict hasil values() di tempat, tanpa membangun dict baru per baris
+            status_labels = dict(Dispute.STATUS_CHOICES)
+            dispute_list = list(rows)
+            for row in dispute_list:
+                row['status_display'] = status_labels.get(row['status'], row['status'])
+                row['supporting_file'] = bool(row['supporting_file'])
+                row['reviewed_by'] = row.pop('reviewer_username')
+
+            # Halaman tidak penuh -> total sudah diketahui tanpa COUNT terpisah
+            if len(dispute_list) < per_page and (dispute_list or page == 1):
+                total = start + len(dispute_list)
+            else:
+                total = disputes.count()
 
             logger.info(f"[ADMIN_DISPUTE_LIST] Disputes fetched by {request.user.username}")
 
             return Response({
                 'disputes': dispute_list,
-                'total': len(dispute_list)
+                'total': total,
+                'pagination': {
+                    'page': page,
+                    'per_page': per_page,
+                    'total': total,
+                    'total_pages': (total + per_page - 1) // per_page
+                }
             }, status=status.HTTP_200_OK)
 
         except Exception as e:
@@ -408,6 +725,17 @@ class AdminDisputeDetailView(APIView):
     """
     permission_classes = [IsAuthenticated, IsAdminOrReadOnly]
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Evidence DOI/URL per dispute; di-fetch sekali per request/job lalu
+        # dipakai ulang oleh approve, re-verify dan pipeline.
+        self._evidence_cache: Dict[int, Optional[Dict[str, Any]]] = {}
+
+    def _get_dispute_evidence(self, dispute: Dispute) -> Optional[Dict[str, Any]]:
+        if dispute.id not in self._evidence_cache:
+            self._evidence_cache[dispute.id] = fetch_dispute_evidence(dispute)
+        return self._evidence_cache[dispute.id]
+
     def get(self, request, dispute_id):
         """Get detail satu dispute"""
         try:
@@ -436,86 +764,6 @@ class AdminDisputeDetailView(APIView):
                 'error': 'Failed to fetch dispute details'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    def _handle_approve(self, dispute, request, review_note, manual_update, re_verify, new_label=None, new_confidence=None, new_summary=None):
-        """Handle approve action for a dispute"""
-        logger.info(f"[ADMIN_DISPUTE_APPROVE] Approving dispute {dispute.id}")
-        
-        # Update dispute status
-        dispute.status = Dispute.STATUS_APPROVED
-        dispute.reviewed_by = request.user
-        dispute.reviewed_at = timezone.now()
-        dispute.review_note = review_note
-        dispute.save()
-        
-        # If manual update is requested, update the verification result
-        if manual_update and new_label:
-            verification = dispute.claim.verification_result
-            if verification:
-                verification.label = new_label
-                if new_confidence is not None:
-                    verification.confidence = new_confidence
-                if new_summary:
-                    verification.summary = new_summary
-                verification.save()
-        
-        # If re-verification is requested, run AI verification
-        if re_verify and dispute.claim:
-            try:
-                # Call AI verification
-                result = call_ai_verify(dispute.claim.text)
-                normalized_result = normalize_ai_response(result)
-                
-                # Update verification result
-                verification = dispute.claim.verification_result
-                if verification:
-                    verification.label = normalized_result.get('label', verification.label)
-                    verification.confidence = normalized_result.get('confidence', verification.confidence)
-                    verification.summary = normalized_result.get('summary', verification.summary)
-                    verification.save()
-                    
-            except Exception as e:
-                logger.error(f"[ADMIN_DISPUTE_APPROVE] Error in AI re-verification: {str(e)}", exc_info=True)
-        
-        return {
-            'status': 'success',
-            'message': 'Dispute approved successfully',
-            'action': 'approve'
-        }
-        
-    def _handle_reject(self, dispute, request, review_note):
-        """Handle reject action for a dispute"""
-        logger.info(f"[ADMIN_DISPUTE_REJECT] Rejecting dispute {dispute.id}")
-        
-        # Update dispute status
-        dispute.status = Dispute.STATUS_REJECTED
-        dispute.reviewed_by = request.user
-        dispute.reviewed_at = timezone.now()
-        dispute.review_note = review_note
-        dispute.save()
-        
-        return {
-            'status': 'success',
-            'message': 'Dispute rejected successfully',
-            'action': 'reject'
-        }
-        
-    def _trigger_pipeline(self, dispute):
-        """Trigger any post-approval pipeline actions"""
-        logger.info(f"[ADMIN_DISPUTE_PIPELINE] Triggering pipeline for dispute {dispute.id}")
-        
-        # Send email notification if email service is available
-        try:
-            from .email_service import email_service
-            if hasattr(dispute, 'reporter_email') and dispute.reporter_email:
-                email_service.send_dispute_decision_email(
-                    email=dispute.reporter_email,
-                    dispute_id=dispute.id,
-                    decision='approved' if dispute.status == Dispute.STATUS_APPROVED else 'rejected',
-                    review_note=dispute.review_note
-                )
-        except Exception as e:
-            logger.error(f"[ADMIN_DISPUTE_PIPELINE] Error sending email: {str(e)}", exc_info=True)
-    
     @transaction.atomic
     def post(self, request, dispute_id):
         """
@@ -535,19 +783,44 @@ class AdminDisputeDetailView(APIView):
                 )
             
             validated_data = serializer.validated_data
+            action = validated_data['action']
+            review_note = validated_data.get('review_note', '')
             
-            # Fetch dispute
-            dispute = Dispute.objects.select_related('claim').get(id=dispute_id)
+            # Klaim dispute dengan satu conditional UPDATE (status masih pending),
+            # sehingga dua admin tidak bisa me-review dispute yang sama.
+            new_status = Dispute.STATUS_APPROVED if action == 'approve' else Dispute.STATUS_REJECTED
+            claimed = Dispute.objects.filter(
+                id=dispute_id,
+                status=Dispute.STATUS_PENDING
+            ).update(
+                status=new_status,
+                reviewed=True,
+                reviewed_by=request.user,
+                reviewed_at=timezone.now(),
+                review_note=review_note
+            )
             
-            # Check if already reviewed
-            if dispute.status != Dispute.STATUS_PENDING:
-                logger.warning(f"[ADMIN_DISPUTE_REVIEW] Dispute {dispute_id} already {dispute.status}")
+            if not claimed:
+                current_status = Dispute.objects.filter(id=dispute_id).values_list('status', flat=True).first()
+                if current_status is None:
+                    raise Dispute.DoesNotExist
+                logger.warning(f"[ADMIN_DISPUTE_REVIEW] Dispute {dispute_id} already {current_status}")
                 return Response({
-                    'error': f'Dispute sudah {dispute.status}. Tidak bisa diubah.'
+                    'error': f'Dispute sudah {current_status}. Tidak bisa diubah.'
                 }, status=status.HTTP_400_BAD_REQUEST)
             
-            action = validated_data['action']
-            review_note = validated_data.get('review_note', '')
+            # .update() tidak memicu post_save, jadi invalidasi cache dashboard manual
+            cache.delete(DASHBOARD_STATS_CACHE_KEY)
+            
+            # Row dispute sudah terkunci oleh UPDATE di atas sampai commit;
+            # select_for_update menegaskan kunci itu untuk pembacaan berikutnya.
+            # Review hanya memakai claim.id + verification_result: teks klaim tidak
+            # ikut di-JOIN, reviewed_by (baris user) juga tidak dibaca.
+            dispute = Dispute.objects.select_related(
+                'claim', 'claim__verification_result'
+            ).defer(
+                'claim__text', 'claim__text_normalized'
+            ).select_for_update(of=('self',)).get(id=dispute_id)
             
             logger.info(f"[ADMIN_DISPUTE_REVIEW] Processing {action} for dispute {dispute_id}")
             
@@ -564,8 +837,13 @@ class AdminDisputeDetailView(APIView):
                     new_summary=validated_data.get('new_summary')
                 )
                 
-                # Trigger pipeline
-                self._trigger_pipeline(dispute)
+                if result.get('job_id'):
+                    # Job re-verify menjalankan pipeline setelah hasil AI tersimpan
+                    return Response(result, status=status.HTTP_202_ACCEPTED)
+                
+                # Trigger pipeline di background setelah commit (evidence yang
+                # sudah di-fetch ikut dikirim agar tidak di-fetch ulang)
+                enqueue_on_commit(process_dispute_pipeline, dispute.id, self._evidence_cache.get(dispute.id))
                 
             # ====== HANDLE REJECT ======
             else:  # action == 'reject'
@@ -589,122 +867,32 @@ class AdminDisputeDetailView(APIView):
                 'detail': str(e) if settings.DEBUG else None
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    def _trigger_pipeline(self, dispute):
-        """
-        Trigger the processing pipeline for DOI parsing and verification
-        
-        Flow:
-        1. Ambil evidence dari DOI/URL yang diberikan user
-        2. Tambahkan sebagai source baru
-        3. Jalankan pipeline verifikasi
-        4. Update verification result
-        5. Cari jurnal serupa
-        6. Kirim notifikasi
-        """
-        logger.info(f"[PIPELINE] Memulai pipeline untuk dispute {dispute.id}")
-        
-        try:
-            # 1. Ambil evidence dari DOI/URL yang diberikan user
-            evidence = None
-            if dispute.supporting_doi:
-                logger.info(f"[PIPELINE] Mengambil evidence dari DOI: {dispute.supporting_doi}")
-                evidence = fetch_evidence_from_doi(dispute.supporting_doi)
-            elif dispute.supporting_url:
-                logger.info(f"[PIPELINE] Mengambil evidence dari URL: {dispute.supporting_url}")
-                evidence = fetch_evidence_from_url(dispute.supporting_url)
-            
-            # 2. Tambahkan sebagai source baru
-            if evidence and dispute.claim:
-                self._add_user_evidence_as_source(dispute.claim, evidence)
-                logger.info("[PIPELINE] Evidence user berhasil ditambahkan sebagai source")
-            
-            # 3. Jalankan pipeline verifikasi
-            if dispute.claim:
-                logger.info("[PIPELINE] Memulai proses verifikasi...")
-                from .ai_adapter import call_ai_verify
-                
-                # Panggil AI untuk memverifikasi ulang dengan evidence tambahan
-                ai_result = call_ai_verify(
-                    claim_text=dispute.claim.text,
-                    additional_evidence=evidence
-                )
-                
-                # 4. Update verification result
-                if ai_result and 'label' in ai_result:
-                    verification, _ = VerificationResult.objects.get_or_create(
-                        claim=dispute.claim
-                    )
-                    verification.label = ai_result['label']
-                    verification.confidence = ai_result.get('confidence')
-                    verification.summary = ai_result.get('summary', '')
-                    verification.reviewer_notes = f"Diperbarui oleh sistem setelah verifikasi ulang untuk dispute #{dispute.id}"
-                    verification.save()
-                    
-                    logger.info(f"[PIPELINE] Verifikasi selesai. Hasil: {ai_result['label']} (confidence: {ai_result.get('confidence')})")
-                    
-                    # 5. Cari jurnal serupa untuk referensi tambahan
-                    self._fetch_similar_journals(dispute.claim)
-                    
-                    # 6. Kirim notifikasi ke admin
-                    try:
-                        from .email_service import email_service
-                        email_service.notify_admin_dispute_processed(dispute)
-                        logger.info("[EMAIL] Notifikasi verifikasi ulang terkirim ke admin")
-                    except Exception as e:
-                        logger.error(f"[EMAIL] Gagal mengirim notifikasi ke admin: {str(e)}", exc=True)
-                    
-                    return True
-                
-        except Exception as e:
-            logger.error(f"[PIPELINE] Error saat memproses pipeline: {str(e)}", exc_info=True)
-            
-            # Kirim notifikasi error ke admin
-            try:
-                from .email_service import email_service
-                email_service.notify_admin_system_error(
-                    error_type="Pipeline Error",
-                    error_message=f"Gagal memproses pipeline untuk dispute #{dispute.id}",
-                    context={"error": str(e), "dispute_id": dispute.id}
-                )
-            except Exception as email_err:
-                logger.error(f"[EMAIL] Gagal mengirim notifikasi error: {str(email_err)}")
-        
-        logger.info(f"[PIPELINE] Proses pipeline selesai untuk dispute {dispute.id}")
-        return False
-
     def _fetch_similar_journals(self, claim, max_retries=3, initial_delay=1):
         """Fetch similar journals with rate limiting and retries."""
         logger.info(f"[JOURNAL_FETCH] Starting journal search for claim {claim.id}")
         
-        def make_request(attempt):
-            try:
-                sch = SemanticScholar(timeout=10)
-                search_query = claim.text[:200]
-                logger.info(f"[JOURNAL_FETCH] Attempt {attempt + 1}: Searching for: {search_query[:50]}...")
-                return sch.search_paper(search_query, limit=2)  # Reduced to 2 results
-            except Exception as e:
-                if "429" in str(e) and attempt < max_retries - 1:
-                    wait_time = initial_delay * (2 ** attempt)  # Exponential backoff
-                    logger.warning(f"[JOURNAL_FETCH] Rate limited. Waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
-                    return None
-                raise
-
         try:
             if not claim.text or len(claim.text.strip()) < 3:
                 logger.warning("[JOURNAL_FETCH] Claim text too short")
                 return False
 
-            # Try with retries
+            sch = _SEMANTIC_SCHOLAR
+            search_query = claim.text[:200]
+
+            # Retry hanya untuk error transient (429 / 5xx), dengan exponential
+            # backoff + full jitter supaya worker tidak retry bersamaan.
             results = None
             for attempt in range(max_retries):
                 try:
-                    results = make_request(attempt)
-                    if results is not None:
-                        break
-                except Exception as e:
+                    logger.info(f"[JOURNAL_FETCH] Attempt {attempt + 1}: Searching for: {search_query[:50]}...")
+                    results = sch.search_paper(search_query, limit=2)  # Reduced to 2 results
+                    break
+                except _SEMANTIC_SCHOLAR_RETRYABLE as e:
                     if attempt == max_retries - 1:
                         raise
+                    wait_time = random.uniform(0, initial_delay * (2 ** attempt))
+                    logger.warning(f"[JOURNAL_FETCH] Transient error ({type(e).__name__}). Waiting {wait_time:.2f}s before retry...")
+                    time.sleep(wait_time)
 
             if not results:
                 logger.warning("[JOURNAL_FETCH] No results after retries")
@@ -742,13 +930,10 @@ class AdminDisputeDetailView(APIView):
             return False
 
         try:
-            # 1. Get evidence (with timeout)
+            # 1. Get evidence
             evidence = None
             try:
-                if dispute.supporting_doi:
-                    evidence = fetch_evidence_from_doi(dispute.supporting_doi)
-                elif dispute.supporting_url:
-                    evidence = fetch_evidence_from_url(dispute.supporting_url)
+                evidence = self._get_dispute_evidence(dispute)
             except Exception as e:
                 logger.error(f"[PIPELINE] Error fetching evidence: {str(e)}")
                 evidence = None
@@ -775,22 +960,15 @@ class AdminDisputeDetailView(APIView):
                     return False
 
                 # Update verification result
-                verification, _ = VerificationResult.objects.get_or_create(
-                    claim=dispute.claim
-                )
-                verification.label = ai_result['label']
-                verification.confidence = ai_result.get('confidence', 0)
-                verification.summary = ai_result.get('summary', '')[:1000]  # Limit length
-                verification.reviewer_notes = f"Updated by system after dispute #{dispute.id}"
-                verification.save()
-
-                # 4. Fetch similar journals in background
-                import threading
-                threading.Thread(
-                    target=self._fetch_similar_journals,
-                    args=(dispute.claim,),
-                    daemon=True
-                ).start()
+                _write_verification(_get_verification_or_new(dispute.claim), {
+                    'label': ai_result['label'],
+                    'confidence': ai_result.get('confidence', 0),
+                    'summary': (ai_result.get('summary') or '')[:SUMMARY_MAX_LENGTH],
+                    'reviewer_notes': f"Updated by system after dispute #{dispute.id}",
+                })
+
+                # 4. Fetch similar journals di worker pool (bounded, bukan thread baru)
+                run_in_background(fetch_similar_journals_task, dispute.claim.id)
 
                 logger.info("[PIPELINE] Verification complete")
                 return True
@@ -803,6 +981,7 @@ class AdminDisputeDetailView(APIView):
             logger.error(f"[PIPELINE] Pipeline failed: {str(e)}", exc_info=True)
             return False
                 
+    @transaction.atomic
     def _handle_approve(self, dispute: Dispute, request, review_note: str,
                     manual_update: bool = False, re_verify: bool = True,
                     new_label: str = None, new_confidence: float = None,
@@ -818,50 +997,33 @@ class AdminDisputeDetailView(APIView):
         """
         logger.info(f"[APPROVE] Starting approval for dispute {dispute.id}")
         
-        # Update dispute status
-        dispute.status = Dispute.STATUS_APPROVED
-        dispute.reviewed = True
-        dispute.reviewed_by = request.user
-        dispute.reviewed_at = timezone.now()
-        dispute.review_note = review_note
-        dispute.save()
+        # Update dispute status (post() sudah melakukannya via conditional UPDATE)
+        if dispute.status != Dispute.STATUS_APPROVED:
+            self._mark_reviewed(dispute, Dispute.STATUS_APPROVED, request.user, review_note)
         
         logger.info(f"[APPROVE] Dispute {dispute.id} status updated to APPROVED")
         
-        # Get or create verification result
+        job_id = None
+        
+        # Verification result (dibuat saat ditulis jika belum ada)
         if dispute.claim:
-            verification, created = VerificationResult.objects.get_or_create(
-                claim=dispute.claim
-            )
-
-            # Kirim notifikasi ke user
-            try:
-                from .email_service import email_service
-                email_service.notify_user_dispute_approved(dispute, review_note)
-                logger.info(f"[EMAIL] Notification sent to {dispute.reporter_email}")
-            except Exception as e:
-                logger.error(f"[EMAIL] Failed to send approval email: {str(e)}", exc_info=True)
+            verification = _get_verification_or_new(dispute.claim)
             
             # MANUAL UPDATE 
             if manual_update and new_label and new_confidence is not None:
                 logger.info(f"[APPROVE] Manual update: label={new_label}, conf={new_confidence}")
                 
-                verification.label = new_label
-                verification.confidence = new_confidence if new_label != 'unverified' else None
-                # Jangan override ringkasan AI jika admin tidak mengisi new_summary
-                verification.summary = new_summary or verification.summary
-                verification.reviewer_notes = f"Admin approved dispute #{dispute.id}\n{review_note}"
-                verification.save()
+                _write_verification(verification, {
+                    'label': new_label,
+                    'confidence': new_confidence if new_label != 'unverified' else None,
+                    # Jangan override ringkasan AI jika admin tidak mengisi new_summary
+                    'summary': new_summary or verification.summary,
+                    'reviewer_notes': f"Admin approved dispute #{dispute.id}\n{review_note}",
+                })
                 
                 # Jika user menyertakan DOI/URL, simpan juga sebagai Source agar muncul di frontend
                 try:
-                    evidence = None
-                    if dispute.supporting_doi:
-                        logger.info(f"[APPROVE] (manual) Fetching evidence from DOI: {dispute.supporting_doi}")
-                        evidence = fetch_evidence_from_doi(dispute.supporting_doi)
-                    elif dispute.supporting_url:
-                        logger.info(f"[APPROVE] (manual) Fetching evidence from URL: {dispute.supporting_url}")
-                        evidence = fetch_evidence_from_url(dispute.supporting_url)
+                    evidence = self._get_dispute_evidence(dispute)
 
                     if evidence:
                         self._add_user_evidence_as_source(dispute.claim, evidence)
@@ -876,73 +1038,18 @@ class AdminDisputeDetailView(APIView):
                 final_confidence = new_confidence
                 final_summary = verification.summary
             
-            # ====== RE-VERIFY WITH AI + USER EVIDENCE ======
+            # ====== RE-VERIFY WITH AI + USER EVIDENCE (background job) ======
             elif re_verify:
-                logger.info(f"[APPROVE] Re-verifying claim with AI and user evidence...")
+                # Panggilan AI bisa 5-30 detik; jangan tahan worker HTTP.
+                # Hasil bisa di-poll via /api/admin/jobs/<job_id>/
+                job_id = create_job('dispute_reverify', dispute_id=dispute.id)
+                enqueue_on_commit(
+                    reverify_dispute, dispute.id, job_id, review_note,
+                    manual_update, new_label, new_confidence, new_summary
+                )
+                logger.info(f"[APPROVE] Re-verify for dispute {dispute.id} queued as job {job_id}")
                 
-                try:
-                    # ====== FETCH EVIDENCE FROM USER'S DOI/URL ======
-                    additional_evidence = None
-                    
-                    if dispute.supporting_doi:
-                        logger.info(f"[APPROVE] Fetching evidence from DOI: {dispute.supporting_doi}")
-                        additional_evidence = fetch_evidence_from_doi(dispute.supporting_doi)
-                        
-                    elif dispute.supporting_url:
-                        logger.info(f"[APPROVE] Fetching evidence from URL: {dispute.supporting_url}")
-                        additional_evidence = fetch_evidence_from_url(dispute.supporting_url)
-                    
-                    if additional_evidence:
-                        logger.info(f"[APPROVE] Evidence fetched: {additional_evidence.get('title', 'N/A')[:50]}")
-                    
-                    # ====== CALL AI WITH EVIDENCE ======
-                    ai_result = call_ai_verify(dispute.claim.text, additional_evidence=additional_evidence)
-                    normalized = normalize_ai_response(ai_result, claim_text=dispute.claim.text)
-                    
-                    logger.info(f"[APPROVE] AI re-verify result: {normalized['label']}")
-                    
-                    # Update verification result dengan hasil AI baru
-                    verification.label = normalized['label']
-                    verification.confidence = normalized['confidence']
-                    verification.summary = normalized['summary']
-                    
-                    # Add note about evidence used
-                    evidence_note = ""
-                    if additional_evidence and additional_evidence.get('title'):
-                        evidence_note = f"\n📎 Evidence used: {additional_evidence.get('title', 'N/A')[:100]}"
-                    
-                    verification.reviewer_notes = f"Admin approved dispute #{dispute.id} with re-verification{evidence_note}\n{review_note}"
-                    verification.save()
-                    
-                    # Update sources jika ada
-                    if normalized['sources']:
-                        self._update_claim_sources(dispute.claim, normalized['sources'])
-                    
-                    # Jika ada evidence dari user, tambahkan juga sebagai Source
-                    if additional_evidence and additional_evidence.get('doi'):
-                        self._add_user_evidence_as_source(dispute.claim, additional_evidence)
-                    
-                    logger.info(f"[APPROVE] VerificationResult {verification.id} updated with AI re-verify + user evidence")
-                    
-                    updated_via = "ai_reverify_with_evidence" if additional_evidence else "ai_reverify"
-                    final_label = normalized['label']
-                    final_confidence = normalized['confidence']
-                    final_summary = normalized['summary']
-                    
-                except Exception as e:
-                    logger.error(f"[APPROVE] AI re-verify failed: {str(e)}")
-                    # Fallback: gunakan manual data jika ada, atau keep original
-                    if manual_update and new_label:
-                        verification.label = new_label
-                        verification.confidence = new_confidence if new_label != 'unverified' else None
-                        verification.summary = new_summary or verification.summary
-                    verification.reviewer_notes = f"Admin approved dispute #{dispute.id} (AI re-verify failed)\n{review_note}"
-                    verification.save()
-                    
-                    updated_via = "manual_fallback"
-                    final_label = verification.label
-                    final_confidence = verification.confidence
-                    final_summary = verification.summary
+                updated_via = "ai_reverify_queued"
             
             else:
                 # Neither manual nor re-verify - keep original
@@ -959,61 +1066,128 @@ class AdminDisputeDetailView(APIView):
             final_confidence = dispute.original_confidence
             final_summary = ""
         
-        # ====== SEND EMAIL NOTIFICATION ======
-        email_sent = False
-        if dispute.reporter_email:
-            try:
-                email_sent = email_service.notify_user_dispute_approved(
-                    dispute=dispute,
-                    admin_notes=review_note
-                )
-                logger.info(f"[APPROVE] Email sent to {dispute.reporter_email}")
-            except Exception as e:
-                logger.error(f"[APPROVE] Failed to send email: {str(e)}")
+        # ====== SEND EMAIL NOTIFICATION (background, setelah commit) ======
+        # Untuk re-verify, email dikirim oleh job setelah hasil AI tersimpan.
+        email_queued = bool(dispute.reporter_email)
+        if email_queued and not job_id:
+            enqueue_on_commit(send_dispute_decision_email, dispute.id, Dispute.STATUS_APPROVED, review_note)
+            logger.info(f"[APPROVE] Email queued for {dispute.reporter_email}")
         
         logger.info(f"[APPROVE] Dispute {dispute.id} approval completed")
         
+        # Re-verify masih berjalan: label lama sudah basi, hasil baru ada di job_id
+        verification_update = None
+        if not job_id:
+            verification_update = {
+                'label': final_label,
+                'confidence': final_confidence,
+                'summary': _summary_preview(final_summary)
+            }
+        
         return {
             'message': f'Dispute #{dispute.id} telah di-approve',
             'dispute_id': dispute.id,
             'status': dispute.status,
             'updated_via': updated_via,
-            'verification_update': {
-                'label': final_label,
-                'confidence': final_confidence,
-                'summary': final_summary[:200] + '...' if final_summary and len(final_summary) > 200 else final_summary
-            },
-            'email_sent': email_sent,
-            'reviewed_at': dispute.reviewed_at.isoformat() if dispute.reviewed_at else None
+            'verification_update': verification_update,
+            'email_queued': email_queued,
+            'job_id': job_id,
+            'job_status': JOB_QUEUED if job_id else None,
+            'reviewed_at': dispute.reviewed_at
         }
 
+    def _reverify_with_ai(self, dispute: Dispute, verification: VerificationResult, review_note: str,
+                          manual_update: bool = False, new_label: str = None,
+                          new_confidence: float = None, new_summary: str = None) -> Dict[str, Any]:
+        """
+        Re-verify klaim dengan AI + evidence dari user (DOI/URL).
+        Dipanggil dari job background reverify_dispute.
+        """
+        logger.info(f"[APPROVE] Re-verifying claim with AI and user evidence...")
+        
+        try:
+            # ====== FETCH EVIDENCE FROM USER'S DOI/URL ======
+            additional_evidence = self._get_dispute_evidence(dispute)
+            
+            if additional_evidence:
+                logger.info(f"[APPROVE] Evidence fetched: {additional_evidence.get('title', 'N/A')[:50]}")
+            
+            # ====== CALL AI WITH EVIDENCE ======
+            ai_result = call_ai_verify(dispute.claim.text, additional_evidence=additional_evidence)
+            normalized = normalize_ai_response(ai_result, claim_text=dispute.claim.text)
+            
+        except Exception as e:
+            logger.error(f"[APPROVE] AI re-verify failed: {str(e)}")
+            # Fallback: gunakan manual data jika ada, atau keep original
+            updates = {}
+            if manual_update and new_label:
+                updates['label'] = new_label
+                updates['confidence'] = new_confidence if new_label != 'unverified' else None
+                updates['summary'] = new_summary or verification.summary
+            updates['reviewer_notes'] = f"Admin approved dispute #{dispute.id} (AI re-verify failed)\n{review_note}"
+            _write_verification(verification, updates)
+            
+            return {
+                'updated_via': "manual_fallback",
+                'label': verification.label,
+                'confidence': verification.confidence,
+                'summary': _summary_preview(verification.summary),
+            }
+        
+        logger.info(f"[APPROVE] AI re-verify result: {normalized['label']}")
+        
+        # Add note about evidence used
+        evidence_note = ""
+        if additional_evidence and additional_evidence.get('title'):
+            evidence_note = f"\n📎 Evidence used: {additional_evidence.get('title', 'N/A')[:100]}"
+        
+        # Update verification result dengan hasil AI baru (satu kali tulis; kegagalan
+        # setelah titik ini tidak boleh menimpa hasil AI dengan fallback)
+        _write_verification(verification, {
+            'label': normalized['label'],
+            'confidence': normalized['confidence'],
+            'summary': (normalized['summary'] or '')[:SUMMARY_MAX_LENGTH],
+            'reviewer_notes': f"Admin approved dispute #{dispute.id} with re-verification{evidence_note}\n{review_note}",
+        })
+        
+        # Update sources jika ada
+        if normalized['sources']:
+            self._update_claim_sources(dispute.claim, normalized['sources'])
+        
+        # Jika ada evidence dari user (DOI atau URL), tambahkan juga sebagai Source
+        if additional_evidence:
+            self._add_user_evidence_as_source(dispute.claim, additional_evidence)
+        
+        logger.info(f"[APPROVE] VerificationResult {verification.id} updated with AI re-verify + user evidence")
+        
+        updated_via = "ai_reverify_with_evidence" if additional_evidence else "ai_reverify"
+        
+        return {
+            'updated_via': updated_via,
+            'label': verification.label,
+            'confidence': verification.confidence,
+            'summary': _summary_preview(verification.summary),
+        }
+
+    @transaction.atomic
     def _handle_reject(self, dispute: Dispute, request, review_note: str) -> Dict[str, Any]:
         """
         Handle dispute rejection - tidak ada perubahan ke verification result.
         """
         logger.info(f"[REJECT] Starting rejection for dispute {dispute.id}")
         
-        # Update dispute status
-        dispute.status = Dispute.STATUS_REJECTED
-        dispute.reviewed = True
-        dispute.reviewed_by = request.user
-        dispute.reviewed_at = timezone.now()
-        dispute.review_note = review_note
-        dispute.save()
+        # Update dispute status (post() sudah melakukannya via conditional UPDATE)
+        if dispute.status != Dispute.STATUS_REJECTED:
+            self._mark_reviewed(dispute, Dispute.STATUS_REJECTED, request.user, review_note)
         
         logger.info(f"[REJECT] Dispute {dispute.id} status updated to REJECTED")
         
-        # ====== SEND EMAIL NOTIFICATION ======
-        email_sent = False
+        # ====== SEND EMAIL NOTIFICATION (background, setelah commit) ======
+        email_queued = False
         if dispute.reporter_email:
-            try:
-                email_sent = email_service.notify_user_dispute_rejected(
-                    dispute=dispute,
-                    admin_notes=review_note
-                )
-                logger.info(f"[REJECT] Email sent to {dispute.reporter_email}")
-            except Exception as e:
-                logger.error(f"[REJECT] Failed to send email: {str(e)}")
+            enqueue_on_commit(send_dispute_decision_email, dispute.id, Dispute.STATUS_REJECTED, review_note)
+            email_queued = True
+            logger.info(f"[REJECT] Email queued for {dispute.reporter_email}")
         
         logger.info(f"[REJECT] Dispute {dispute.id} rejection completed")
         
@@ -1022,46 +1196,24 @@ class AdminDisputeDetailView(APIView):
             'dispute_id': dispute.id,
             'status': dispute.status,
             'reason': 'Laporan ditolak. Verification result original tetap berlaku.',
-            'email_sent': email_sent,
-            'reviewed_at': dispute.reviewed_at.isoformat() if dispute.reviewed_at else None
+            'email_queued': email_queued,
+            'reviewed_at': dispute.reviewed_at
         }
 
+    def _mark_reviewed(self, dispute: Dispute, new_status: str, user, review_note: str):
+        """Simpan hasil review hanya untuk kolom yang berubah."""
+        dispute.status = new_status
+        dispute.reviewed = True
+        dispute.reviewed_by = user
+        dispute.reviewed_at = timezone.now()
+        dispute.review_note = review_note
+        dispute.save(update_fields=['status', 'reviewed', 'reviewed_by', 'reviewed_at', 'review_note'])
+
     def _update_claim_sources(self, claim: Claim, new_sources: List[Dict[str, Any]]):
-        """Update sources untuk klaim berdasarkan hasil AI."""
+        """Update sources untuk klaim berdasarkan hasil AI (bulk insert, atomic)."""
         try:
-            # Clear existing sources
-            ClaimSource.objects.filter(claim=claim).delete()
-            logger.info(f"[SOURCES] Cleared old sources for claim {claim.id}")
-            
-            # Add new sources
-            for idx, source_data in enumerate(new_sources):
-                # Get or create source
-                doi = (source_data.get('doi') or '').strip()
-                url = (source_data.get('url') or '').strip()
-                
-                source = None
-                if doi:
-                    source = Source.objects.filter(doi=doi).first()
-                elif url:
-                    source = Source.objects.filter(url=url).first()
-                
-                if not source:
-                    source = Source.objects.create(
-                        title=source_data.get('title', 'Unknown')[:500],
-                        doi=doi if doi else None,
-                        url=url if url else None,
-                        source_type=source_data.get('source_type', 'journal'),
-                        credibility_score=source_data.get('relevance_score', 0.5)
-                    )
-                
-                # Create claim-source link
-                ClaimSource.objects.create(
-                    claim=claim,
-                    source=source,
-                    relevance_score=source_data.get('relevance_score', 0.0),
-                    excerpt=source_data.get('excerpt', ''),
-                    rank=idx
-                )
+            with transaction.atomic():
+                self._replace_claim_sources(claim, new_sources)
             
             logger.info(f"[SOURCES] Added {len(new_sources)} new sources for claim {claim.id}")
             return True
@@ -1070,6 +1222,82 @@ class AdminDisputeDetailView(APIView):
             logger.error(f"[SOURCES] Error updating sources: {str(e)}")
             return False
 
+    def _replace_claim_sources(self, claim: Claim, new_sources: List[Dict[str, Any]]):
+        """Ganti link source klaim dengan jumlah query konstan (bukan per baris)."""
+        entries = []
+        for source_data in new_sources:
+            doi = (source_data.get('doi') or '').strip()
+            url = (source_data.get('url') or '').strip()
+            # Source dicocokkan via DOI jika ada, selain itu via URL
+            key = ('doi', doi) if doi else (('url', url) if url else None)
+            entries.append((key, doi, url, source_data))
+        
+        # Lookup source yang sudah ada dalam satu query
+        dois = {key[1] for key, *_ in entries if key and key[0] == 'doi'}
+        urls = {key[1] for key, *_ in entries if key and key[0] == 'url'}
+        existing = {}
+        if dois or urls:
+            matches = Source.objects.filter(Q(doi__in=dois) | Q(url__in=urls)).order_by('-id')
+            for source in matches:
+                if source.doi in dois:
+                    existing[('doi', source.doi)] = source
+                if source.url in urls:
+                    existing[('url', source.url)] = source
+        
+        # Buat source yang belum ada sekaligus
+        to_create = []
+        resolved = []
+        for key, doi, url, source_data in entries:
+            source = existing.get(key) if key else None
+            if source is None:
+                source = Source(
+                    title=source_data.get('title', 'Unknown')[:500],
+                    doi=doi if doi else None,
+                    url=url if url else None,
+                    source_type=source_data.get('source_type', 'journal'),
+                    credibility_score=source_data.get('relevance_score', 0.5)
+                )
+                to_create.append(source)
+                if key:
+                    existing[key] = source
+            resolved.append((source, source_data))
+        
+        if to_create:
+            Source.objects.bulk_create(to_create)
+            # bulk_create tidak memicu post_save
+            cache.delete_many([
+                DASHBOARD_STATS_CACHE_KEY, SOURCE_STATS_CACHE_KEY, SOURCE_TABLE_ETAG_CACHE_KEY
+            ])
+        
+        # Duplikat source dalam batch: kemunculan pertama dipakai
+        unique = {}
+        for source, source_data in resolved:
+            unique.setdefault(source.id, (source, source_data))
+        
+        # Link claim-source; rank dinomori setelah dedup agar berurutan tanpa celah
+        links = {
+            source.id: ClaimSource(
+                claim=claim,
+                source=source,
+                relevance_score=source_data.get('relevance_score', 0.0),
+                excerpt=source_data.get('excerpt', ''),
+                rank=rank
+            )
+            for rank, (source, source_data) in enumerate(unique.values())
+        }
+        
+        # Hapus hanya link yang tidak ada di hasil baru; sisanya di-upsert
+        # di tempat (tanpa delete + insert ulang seluruh baris)
+        removed, _ = ClaimSource.objects.filter(claim=claim).exclude(source_id__in=links).delete()
+        logger.info(f"[SOURCES] Removed {removed} stale sources for claim {claim.id}")
+        
+        ClaimSource.objects.bulk_create(
+            links.values(),
+            update_conflicts=True,
+            unique_fields=['claim', 'source'],
+            update_fields=['relevance_score', 'excerpt', 'rank']
+        )
+
     def _add_user_evidence_as_source(self, claim: Claim, evidence: Dict[str, Any]):
         """
         Tambahkan evidence dari user dispute sebagai Source baru.
@@ -1083,12 +1311,9 @@ class AdminDisputeDetailView(APIView):
                 logger.warning("[USER_EVIDENCE] No DOI or URL in evidence, skipping")
                 return
             
-            # Check if source already exists
-            existing = None
-            if doi:
-                existing = Source.objects.filter(doi=doi).first()
-            elif url:
-                existing = Source.objects.filter(url=url).first()
+            # Check if source already exists (DOI prioritas, selain itu URL; keduanya ter-index)
+            lookup = {'doi': doi} if doi else {'url': url}
+            existing = Source.objects.filter(**lookup).order_by('id').first()
             
             if existing:
                 logger.info(f"[USER_EVIDENCE] Source already exists: {existing.id}")
@@ -1106,23 +1331,188 @@ class AdminDisputeDetailView(APIView):
                 )
                 logger.info(f"[USER_EVIDENCE] Created new source: {source.id}")
             
-            # Link to claim with high relevance
-            ClaimSource.objects.get_or_create(
-                claim=claim,
-                source=source,
-                defaults={
-                    'relevance_score': 0.95,
-                    'excerpt': evidence.get('abstract', '')[:500],
-                    'rank': 0  # Top rank
-                }
-            )
+            # Link to claim with high relevance.
+            # Satu INSERT ... ON CONFLICT DO NOTHING (unique claim+source),
+            # menggantikan SELECT + INSERT get_or_create dan aman saat race.
+            ClaimSource.objects.bulk_create([
+                ClaimSource(
+                    claim=claim,
+                    source=source,
+                    relevance_score=0.95,
+                    excerpt=evidence.get('abstract', '')[:500],
+                    rank=0  # Top rank
+                )
+            ], ignore_conflicts=True)
             
             logger.info(f"[USER_EVIDENCE] Linked source {source.id} to claim {claim.id}")
             
         except Exception as e:
             logger.error(f"[USER_EVIDENCE] Error adding user evidence: {str(e)}")
 
-            
+
+
+def process_dispute_pipeline(dispute_id: int, evidence: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Task background: jalankan pipeline verifikasi ulang untuk dispute.
+    Dispute di-fetch ulang by id agar instance ORM tidak dibagi antar thread.
+    evidence: hasil fetch DOI/URL dari langkah approve (jika ada), dipakai ulang.
+    """
+    try:
+        dispute = Dispute.objects.select_related(
+            'claim', 'claim__verification_result'
+        ).get(id=dispute_id)
+    except Dispute.DoesNotExist:
+        logger.warning(f"[PIPELINE] Dispute {dispute_id} not found, skipping")
+        return False
+
+    view = AdminDisputeDetailView()
+    if evidence is not None:
+        view._evidence_cache[dispute.id] = evidence
+    return view._trigger_pipeline(dispute)
+
+
+def reverify_dispute(dispute_id: int, job_id: str, review_note: str = '',
+                     manual_update: bool = False, new_label: str = None,
+                     new_confidence: float = None, new_summary: str = None) -> bool:
+    """
+    Task background: re-verify klaim dispute yang di-approve dengan AI.
+    Status & hasil ditulis ke job cache agar admin bisa polling.
+    """
+    update_job(job_id, status=JOB_RUNNING)
+    try:
+        dispute = Dispute.objects.select_related(
+            'claim', 'claim__verification_result'
+        ).get(id=dispute_id)
+    except Dispute.DoesNotExist:
+        logger.warning(f"[REVERIFY] Dispute {dispute_id} not found, skipping")
+        update_job(job_id, status=JOB_FAILED, error='Dispute not found')
+        return False
+
+    view = AdminDisputeDetailView()
+    try:
+        with transaction.atomic():
+            outcome = view._reverify_with_ai(
+                dispute, _get_verification_or_new(dispute.claim), review_note,
+                manual_update, new_label, new_confidence, new_summary
+            )
+    except Exception as e:
+        update_job(job_id, status=JOB_FAILED, error=str(e))
+        raise
+
+    update_job(job_id, status=JOB_DONE, result=outcome)
+    logger.info(f"[REVERIFY] Job {job_id} for dispute {dispute_id} done via {outcome['updated_via']}")
+
+    if dispute.reporter_email:
+        send_dispute_decision_email(dispute.id, Dispute.STATUS_APPROVED, review_note)
+
+    if outcome['updated_via'] == 'manual_fallback':
+        # AI re-verify gagal: pipeline penuh mencoba verifikasi sekali lagi
+        run_in_background(process_dispute_pipeline, dispute.id, view._evidence_cache.get(dispute.id))
+    else:
+        # Hasil AI + evidence sudah tersimpan; jangan panggil AI lagi lewat pipeline
+        run_in_background(fetch_similar_journals_task, dispute.claim.id)
+    return True
+
+
+def send_dispute_decision_email(dispute_id: int, decision: str, admin_notes: str = '') -> bool:
+    """
+    Task background: kirim email keputusan dispute ke pelapor.
+    Dijadwalkan via enqueue_on_commit sehingga response review tidak menunggu SMTP.
+    """
+    try:
+        dispute = Dispute.objects.select_related(
+            'claim', 'claim__verification_result'
+        ).get(id=dispute_id)
+    except Dispute.DoesNotExist:
+        logger.warning(f"[EMAIL] Dispute {dispute_id} not found, skipping decision email")
+        return False
+
+    if decision == Dispute.STATUS_APPROVED:
+        sent = email_service.notify_user_dispute_approved(dispute=dispute, admin_notes=admin_notes)
+    else:
+        sent = email_service.notify_user_dispute_rejected(dispute=dispute, admin_notes=admin_notes)
+
+    logger.info(f"[EMAIL] Decision email ({decision}) for dispute {dispute_id} sent={sent}")
+    return sent
+
+
+def fetch_similar_journals_task(claim_id: int) -> bool:
+    """
+    Task background: cari jurnal serupa untuk klaim.
+    Claim di-fetch ulang by id agar instance ORM tidak dibagi antar thread.
+    """
+    try:
+        claim = Claim.objects.get(id=claim_id)
+    except Claim.DoesNotExist:
+        logger.warning(f"[JOURNAL_FETCH] Claim {claim_id} not found, skipping")
+        return False
+
+    return AdminDisputeDetailView()._fetch_similar_journals(claim)
+
+
+class AdminJobStatusView(APIView):
+    """
+    GET /api/admin/jobs/<job_id>/
+    
+    Polling status job background (mis. re-verify dispute).
+    """
+    permission_classes = [IsAuthenticated, IsAdminOrReadOnly]
+
+    def get(self, request, job_id):
+        job = get_job(job_id)
+        if job is None:
+            return Response({
+                'error': 'Job not found or expired'
+            }, status=status.HTTP_404_NOT_FOUND)
+        return Response(job, status=status.HTTP_200_OK)
+
+
+# Harus sama dengan config trigger search_vector di migration 0018
+SOURCE_SEARCH_CONFIG = 'english'
+
+def _compute_source_table_etag() -> str:
+    """
+    ETag tabel Source: jumlah baris + updated_at terbaru.
+    COUNT ikut dihitung karena delete tidak mengubah MAX(updated_at).
+    """
+    state = Source.objects.aggregate(n=Count('id'), last=Max('updated_at'))
+    last = state['last'].timestamp() if state['last'] else 0
+    return f"{state['n']}-{last}"
+
+
+def _source_table_etag(request, *args, **kwargs) -> str:
+    """Ambil ETag dari cache; query aggregate hanya saat cache miss."""
+    return cache.get_or_set(
+        SOURCE_TABLE_ETAG_CACHE_KEY,
+        _compute_source_table_etag,
+        timeout=SOURCE_STATS_CACHE_TIMEOUT
+    )
+
+
+def _source_table_condition(view_func):
+    """
+    condition() dengan ETag tabel Source, tapi ETag hanya dikirim pada
+    response sukses (error tidak boleh ikut di-cache klien).
+    """
+    conditional = condition(etag_func=_source_table_etag)(view_func)
+
+    @wraps(view_func)
+    def inner(request, *args, **kwargs):
+        response = conditional(request, *args, **kwargs)
+        if response.status_code >= 400 and response.has_header('ETag'):
+            del response['ETag']
+        return response
+
+    return inner
+
+
+# Kolom yang dikirim di daftar source admin
+SOURCE_LIST_FIELDS = (
+    'id', 'title', 'url', 'credibility_score',
+    'source_type', 'created_at', 'updated_at'
+)
+
+
 class AdminSourceListView(APIView):
     """
     GET /api/admin/sources/
@@ -1132,43 +1522,52 @@ class AdminSourceListView(APIView):
     """
     permission_classes = [IsAuthenticated, IsAdminOrReadOnly]
 
+    # Polling dashboard: 304 tanpa query halaman/serialisasi jika tabel tidak berubah
+    @method_decorator(_source_table_condition)
     def get(self, request):
         """List all sources with pagination and search"""
         try:
             search = request.GET.get('search', '')
             page = int(request.GET.get('page', 1))
             per_page = int(request.GET.get('per_page', 20))
+            # ?cursor= (boleh kosong untuk halaman pertama) -> keyset pagination
+            use_cursor = 'cursor' in request.GET
             
             sources = Source.objects.all()
+            ordering = ('-created_at', '-id')
             
             # Search by title or url
             if search:
-                from django.db.models import Q
-                sources = sources.filter(
-                    Q(title__icontains=search) | 
-                    Q(url__icontains=search)
-                )
-            
-            # Order by created date
-            sources = sources.order_by('-created_at')
-            
-            # Pagination
-            total = sources.count()
+                substring_match = Q(title__icontains=search) | Q(url__icontains=search)
+                if connection.vendor == 'postgresql':
+                    # Full-text via GIN index search_vector (diisi trigger, migration 0018),
+                    # OR substring via trigram GIN index UPPER(title/url) (migration 0017)
+                    # agar potongan kata / URL tetap ketemu; match substring saja rank-nya 0
+                    query = SearchQuery(search, search_type='websearch', config=SOURCE_SEARCH_CONFIG)
+                    sources = sources.filter(Q(search_vector=query) | substring_match)
+                    # Mode cursor harus urut (created_at, id), jadi tanpa ranking
+                    if not use_cursor:
+                        sources = sources.annotate(rank=SearchRank(F('search_vector'), query))
+                        ordering = ('-rank',) + ordering
+                else:
+                    sources = sources.filter(substring_match)
+            
+            if use_cursor:
+                return self._list_after_cursor(request, sources, per_page)
+            
+            # Order by relevansi/created date (id sebagai tie-breaker agar urutan halaman stabil)
+            sources = sources.order_by(*ordering)
+            
+            # Pagination: ambil halaman dulu (kolom yang dipakai saja)
             start = (page - 1) * per_page
             end = start + per_page
-            sources_page = sources[start:end]
+            source_list = list(sources.values(*SOURCE_LIST_FIELDS)[start:end])
             
-            source_list = []
-            for source in sources_page:
-                source_list.append({
-                    'id': source.id,
-                    'title': source.title,
-                    'url': source.url,
-                    'credibility_score': source.credibility_score,
-                    'source_type': source.source_type,
-                    'created_at': source.created_at.isoformat(),
-                    'updated_at': source.updated_at.isoformat(),
-                })
+            # Halaman tidak penuh -> total sudah diketahui tanpa COUNT terpisah
+            if len(source_list) < per_page and (source_list or page == 1):
+                total = start + len(source_list)
+            else:
+                total = sources.count()
             
             logger.info(f"[ADMIN_SOURCES] Listed {len(source_list)} sources (page {page}) by {request.user.username}")
             
@@ -1188,6 +1587,43 @@ class AdminSourceListView(APIView):
                 'error': 'Failed to fetch sources'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    def _list_after_cursor(self, request, sources, per_page: int):
+        """
+        Keyset pagination: baris setelah (created_at, id) terakhir halaman sebelumnya.
+        Memakai index (created_at DESC, id DESC), biaya tetap O(per_page) di halaman mana pun.
+        """
+        cursor = request.GET.get('cursor', '')
+        if cursor:
+            cursor_created_at = parse_datetime(cursor)
+            cursor_id = request.GET.get('cursor_id', '')
+            if cursor_created_at is None or not cursor_id.isdigit():
+                return Response({
+                    'error': 'Invalid cursor'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            sources = sources.filter(
+                Q(created_at__lt=cursor_created_at) |
+                Q(created_at=cursor_created_at, id__lt=int(cursor_id))
+            )
+        
+        # Ambil satu baris ekstra untuk tahu apakah masih ada halaman berikutnya
+        rows = list(sources.order_by('-created_at', '-id').values(*SOURCE_LIST_FIELDS)[:per_page + 1])
+        
+        has_next = len(rows) > per_page
+        source_list = rows[:per_page]
+        last = source_list[-1] if has_next else None
+        
+        logger.info(f"[ADMIN_SOURCES] Listed {len(source_list)} sources (cursor) by {request.user.username}")
+        
+        return Response({
+            'sources': source_list,
+            'pagination': {
+                'per_page': per_page,
+                'has_next': has_next,
+                'next_cursor': last['created_at'] if last else None,
+                'next_cursor_id': last['id'] if last else None
+            }
+        }, status=status.HTTP_200_OK)
+
     def post(self, request):
         """Create new source"""
         try:
@@ -1236,7 +1672,7 @@ class AdminSourceListView(APIView):
                     'url': source.url,
                     'credibility_score': source.credibility_score,
                     'source_type': source.source_type,
-                    'created_at': source.created_at.isoformat()
+                    'created_at': source.created_at
                 }
             }, status=status.HTTP_201_CREATED)
             
@@ -1267,8 +1703,8 @@ class AdminSourceDetailView(APIView):
                 'url': source.url,
                 'credibility_score': source.credibility_score,
                 'source_type': source.source_type,
-                'created_at': source.created_at.isoformat(),
-                'updated_at': source.updated_at.isoformat(),
+                'created_at': source.created_at,
+                'updated_at': source.updated_at,
             }, status=status.HTTP_200_OK)
             
         except Source.DoesNotExist:
@@ -1308,12 +1744,12 @@ class AdminSourceDetailView(APIView):
                     'error': f'Invalid credibility score: {str(e)}'
                 }, status=status.HTTP_400_BAD_REQUEST)
             
-            # Update
+            # Update (hanya kolom yang bisa diedit; save() tetap memicu invalidasi cache stats)
             source.title = title
             source.url = url
             source.credibility_score = credibility_score
             source.source_type = source_type
-            source.save()
+            source.save(update_fields=['title', 'url', 'credibility_score', 'source_type', 'updated_at'])
             
             logger.info(f"[ADMIN_SOURCE_UPDATE] Updated source #{source_id} by {request.user.username}")
             
@@ -1325,7 +1761,7 @@ class AdminSourceDetailView(APIView):
                     'url': source.url,
                     'credibility_score': source.credibility_score,
                     'source_type': source.source_type,
-                    'updated_at': source.updated_at.isoformat()
+                    'updated_at': source.updated_at
                 }
             }, status=status.HTTP_200_OK)
             
@@ -1371,35 +1807,43 @@ class AdminSourceStatsView(APIView):
     """
     permission_classes = [IsAuthenticated, IsAdminOrReadOnly]
 
+    @method_decorator(_source_table_condition)
     def get(self, request):
         try:
-            total_sources = Source.objects.count()
-            
-            # Sources by type
-            sources_by_type = Source.objects.values('source_type').annotate(
-                count=Count('id')
-            ).order_by('-count')
-            
-            # Average credibility score
-            from django.db.models import Avg
-            avg_credibility = Source.objects.aggregate(
-                avg=Avg('credibility_score')
-            )['avg'] or 0
-            
-            # Recent sources
-            recent_sources = Source.objects.order_by('-created_at')[:5].values(
-                'id', 'title', 'url', 'credibility_score', 'created_at'
+            data = cache.get_or_set(
+                SOURCE_STATS_CACHE_KEY,
+                self._compute_stats,
+                timeout=SOURCE_STATS_CACHE_TIMEOUT
             )
             
-            return Response({
-                'total_sources': total_sources,
-                'sources_by_type': list(sources_by_type),
-                'avg_credibility': float(avg_credibility),
-                'recent_sources': list(recent_sources)
-            }, status=status.HTTP_200_OK)
+            return Response(data, status=status.HTTP_200_OK)
             
         except Exception as e:
             logger.error(f"[ADMIN_SOURCE_STATS] Error: {str(e)}", exc_info=True)
             return Response({
                 'error': 'Failed to fetch source stats'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    def _compute_stats(self) -> Dict[str, Any]:
+        """Hitung statistik sources (dipanggil saat cache miss)."""
+        # Sources by type; total & average credibility diturunkan dari GROUP BY
+        # yang sama (credibility_score NOT NULL), jadi tanpa query aggregate terpisah
+        by_type = list(Source.objects.values('source_type').annotate(
+            count=Count('id'),
+            credibility_sum=Sum('credibility_score')
+        ).order_by('-count'))
+        
+        total = sum(row['count'] for row in by_type)
+        credibility_sum = sum(row.pop('credibility_sum') or 0 for row in by_type)
+        
+        # Recent sources
+        recent_sources = Source.objects.order_by('-created_at')[:5].values(
+            'id', 'title', 'url', 'credibility_score', 'created_at'
+        )
+        
+        return {
+            'total_sources': total,
+            'sources_by_type': by_type,
+            'avg_credibility': float(credibility_sum / total) if total else 0.0,
+            'recent_sources': list(recent_sources)
+        }
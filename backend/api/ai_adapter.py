@@ -1,12 +1,15 @@
 import os
 import sys
-import json
-import subprocess
 import hashlib
+import heapq
 import time
 import logging
 import requests
 import re
+import threading
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
@@ -33,14 +36,56 @@ if not VERIFY_SCRIPT.exists():
 
 
 # Configuration
-VERIFICATION_TIMEOUT = 90  
-MAX_RETRIES = 2
-SIMPLE_CLAIM_WORD_THRESHOLD = 20
+URL_VALIDATION_MAX_WORKERS = 5
+MAX_RETURNED_SOURCES = 5
+VALID_CONFIDENCE_THRESHOLD = 0.75
+HOAX_CONFIDENCE_THRESHOLD = 0.50
+
+_NON_SPACE_RE = re.compile(r'\S')
+
+# Objek JSON dengan satu tingkat nesting di tengah output (fallback parser)
+_JSON_OBJECT_RE = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.DOTALL)
+
+
+# Kata kunci & pola medis untuk is_health_related_claim (dikompilasi sekali per proses)
+_HEALTH_KEYWORDS = frozenset({
+    # Indonesia
+    'kesehatan', 'penyakit', 'obat', 'vitamin', 'diet', 'nutrisi',
+    'medis', 'dokter', 'rumah sakit', 'terapi', 'pengobatan',
+    'kanker', 'diabetes', 'jantung', 'darah', 'kulit', 'wajah',
+    'imun', 'infeksi', 'virus', 'bakteri', 'gejala', 'diagnosa',
+    'vaksin', 'antibiotik', 'herbal', 'suplemen', 'olahraga',
+    'tidur', 'stress', 'mental', 'depresi', 'kecemasan',
+    'merokok', 'rokok', 'tembakau', 'paru', 'asap',
+    # English
+    'health', 'disease', 'medicine', 'nutrition',
+    'medical', 'doctor', 'hospital', 'therapy', 'treatment',
+    'cancer', 'heart', 'blood', 'skin', 'immune',
+    'infection', 'bacteria', 'symptom', 'diagnosis',
+    'vaccine', 'antibiotic', 'supplement', 'exercise',
+    'sleep', 'depression', 'anxiety',
+    'smoking', 'cigarette', 'tobacco', 'lung', 'smoke',
+})
+
+_MEDICAL_PATTERNS = [re.compile(pattern, re.I) for pattern in (
+    r'\b(cause[s]?|menyebabkan)\s+(cancer|kanker|disease|penyakit)',
+    r'\b(prevent[s]?|mencegah)\s+(disease|penyakit|infection|infeksi)',
+    r'\b(risk|risiko)\s+(of|dari)\s+(cancer|kanker|disease|penyakit)',
+    r'\b(smoking|merokok)\b.*\b(lung|paru|cancer|kanker)',
+    r'\b(treatment|pengobatan|terapi)\s+(for|untuk)',
+)]
 
 # Global module cache for direct import
 _optimized_module = None
+# Pesan error import pertama; import yang gagal tidak diulang di setiap verifikasi
+_optimized_module_error = None
 _original_module = None
 
+# Client Gemini satu per proses, dipakai ai_adapter & views: (api_key, client).
+# Disimpan sebagai satu tuple supaya key & client selalu dibaca berpasangan.
+_gemini_client_entry = None
+_gemini_client_lock = threading.Lock()
+
 def safe_float(value, default: float = 0.0) -> float:
     """Konversi ke float dengan aman; fallback ke default jika gagal."""
     try:
@@ -85,45 +130,13 @@ def is_health_related_claim(claim_text: str, summary: str = "") -> bool:
     """
     IMPROVED: Deteksi health-related dengan support BILINGUAL.
     """
-    # Expanded keywords - lebih comprehensive
-    health_keywords_id = {
-        'kesehatan', 'penyakit', 'obat', 'vitamin', 'diet', 'nutrisi',
-        'medis', 'dokter', 'rumah sakit', 'terapi', 'pengobatan',
-        'kanker', 'diabetes', 'jantung', 'darah', 'kulit', 'wajah',
-        'imun', 'infeksi', 'virus', 'bakteri', 'gejala', 'diagnosa',
-        'vaksin', 'antibiotik', 'herbal', 'suplemen', 'olahraga',
-        'tidur', 'stress', 'mental', 'depresi', 'kecemasan',
-        'merokok', 'rokok', 'tembakau', 'paru', 'asap'  # TAMBAHAN
-    }
-    
-    health_keywords_en = {
-        'health', 'disease', 'medicine', 'vitamin', 'diet', 'nutrition',
-        'medical', 'doctor', 'hospital', 'therapy', 'treatment',
-        'cancer', 'diabetes', 'heart', 'blood', 'skin', 'immune',
-        'infection', 'virus', 'bacteria', 'symptom', 'diagnosis',
-        'vaccine', 'antibiotic', 'supplement', 'exercise',
-        'sleep', 'stress', 'mental', 'depression', 'anxiety',
-        'smoking', 'cigarette', 'tobacco', 'lung', 'smoke'  # TAMBAHAN
-    }
-    
-    # Medical patterns untuk deteksi lebih luas
-    medical_patterns = [
-        r'\b(cause[s]?|menyebabkan)\s+(cancer|kanker|disease|penyakit)',
-        r'\b(prevent[s]?|mencegah)\s+(disease|penyakit|infection|infeksi)',
-        r'\b(risk|risiko)\s+(of|dari)\s+(cancer|kanker|disease|penyakit)',
-        r'\b(smoking|merokok)\b.*\b(lung|paru|cancer|kanker)',
-        r'\b(treatment|pengobatan|terapi)\s+(for|untuk)',
-    ]
-    
     combined_text = (claim_text + " " + summary).lower()
-    all_keywords = health_keywords_id | health_keywords_en
     
     # Method 1: Keyword matching
-    keyword_matches = sum(1 for kw in all_keywords if kw in combined_text)
+    keyword_matches = sum(1 for kw in _HEALTH_KEYWORDS if kw in combined_text)
     
     # Method 2: Pattern matching
-    pattern_matches = sum(1 for pattern in medical_patterns 
-                         if re.search(pattern, combined_text, re.I))
+    pattern_matches = sum(1 for pattern in _MEDICAL_PATTERNS if pattern.search(combined_text))
     
     total_matches = keyword_matches + pattern_matches
     
@@ -151,57 +164,60 @@ def determine_verification_label(confidence_score: float, has_sources: bool = Tr
     except (TypeError, ValueError):
         c = 0.0
 
-    # Check if health-related
+    # RULE A: Jika tidak ada jurnal terkait ATAU BUKAN klaim kesehatan -> UNVERIFIED
+    # Di sini kita mensyaratkan keberadaan jurnal (DOI / source_type='journal'),
+    # bukan hanya website biasa. Cek jurnal dulu: scan keyword/pola kesehatan atas
+    # klaim + ringkasan tidak perlu dijalankan kalau hasilnya pasti UNVERIFIED.
+    if not has_journal:
+        logger.info(f"[LABEL] Confidence: {c:.2f}, Has sources: {has_sources} -> UNVERIFIED (no journal sources)")
+        return "unverified"
+
     is_health = is_health_related_claim(claim_text, summary)
 
     logger.info(
         f"[LABEL] Confidence: {c:.2f}, Has sources: {has_sources}, Has journal: {has_journal}, Is health: {is_health}"
     )
 
-    # RULE A: Jika BUKAN klaim kesehatan ATAU tidak ada jurnal terkait -> UNVERIFIED
-    # Di sini kita mensyaratkan keberadaan jurnal (DOI / source_type='journal'),
-    # bukan hanya website biasa.
-    if (not is_health) or (not has_journal):
-        logger.info("[LABEL] -> UNVERIFIED (non-health topic or no journal sources)")
+    if not is_health:
+        logger.info("[LABEL] -> UNVERIFIED (non-health topic)")
         return "unverified"
 
     # RULE B: Klaim kesehatan dengan jurnal terkait
-    #  - c >= 0.75  -> VALID
-    #  - c <= 0.50  -> HOAX
-    #  - 0.50 < c < 0.75 -> UNCERTAIN
-    if c >= 0.75:
-        logger.info(f"[LABEL] -> VALID (confidence {c:.2f} >= 0.75)")
+    #  - c >= VALID_CONFIDENCE_THRESHOLD  -> VALID
+    #  - c <= HOAX_CONFIDENCE_THRESHOLD   -> HOAX
+    #  - di antaranya                     -> UNCERTAIN
+    if c >= VALID_CONFIDENCE_THRESHOLD:
+        logger.info(f"[LABEL] -> VALID (confidence {c:.2f} >= {VALID_CONFIDENCE_THRESHOLD})")
         return "valid"
-    if c <= 0.50:
-        logger.info(f"[LABEL] -> HOAX (confidence {c:.2f} <= 0.50)")
+    if c <= HOAX_CONFIDENCE_THRESHOLD:
+        logger.info(f"[LABEL] -> HOAX (confidence {c:.2f} <= {HOAX_CONFIDENCE_THRESHOLD})")
         return "hoax"
 
-    logger.info(f"[LABEL] -> UNCERTAIN (0.50 < {c:.2f} < 0.75)")
+    logger.info(f"[LABEL] -> UNCERTAIN ({HOAX_CONFIDENCE_THRESHOLD} < {c:.2f} < {VALID_CONFIDENCE_THRESHOLD})")
     return "uncertain"
 
+# Label mentah dari AI -> label backend (dibangun sekali, dipakai tiap verifikasi)
+_AI_LABEL_MAPPING = {
+    'true': 'valid', 'valid': 'valid', 'supported': 'valid', 
+    'verified': 'valid', 'benar': 'valid', 'fakta': 'valid',
+    
+    'false': 'hoax', 'hoax': 'hoax', 'refuted': 'hoax',
+    'debunked': 'hoax', 'salah': 'hoax',
+    
+    'uncertain': 'uncertain', 'partially_valid': 'uncertain',
+    'partial': 'uncertain', 'misleading': 'uncertain',
+    'mixed': 'uncertain', 'tidak_pasti': 'uncertain',
+    
+    'unverified': 'unverified', 'inconclusive': 'unverified',
+    'unclear': 'unverified', 'insufficient': 'unverified',
+}
+
 def map_ai_label_to_backend(ai_label: str) -> str:
     """Map label dari AI ke format backend."""
     if not ai_label:
         return 'unverified'
     
-    label_lower = ai_label.lower().strip()
-    
-    label_mapping = {
-        'true': 'valid', 'valid': 'valid', 'supported': 'valid', 
-        'verified': 'valid', 'benar': 'valid', 'fakta': 'valid',
-        
-        'false': 'hoax', 'hoax': 'hoax', 'refuted': 'hoax',
-        'debunked': 'hoax', 'salah': 'hoax',
-        
-        'uncertain': 'uncertain', 'partially_valid': 'uncertain',
-        'partial': 'uncertain', 'misleading': 'uncertain',
-        'mixed': 'uncertain', 'tidak_pasti': 'uncertain',
-        
-        'unverified': 'unverified', 'inconclusive': 'unverified',
-        'unclear': 'unverified', 'insufficient': 'unverified',
-    }
-    
-    return label_mapping.get(label_lower, 'unverified')
+    return _AI_LABEL_MAPPING.get(ai_label.strip().lower(), 'unverified')
 
 def normalize_ai_response(ai_result: Dict[str, Any], claim_text: str = "") -> Dict[str, Any]:
     """
@@ -229,11 +245,8 @@ def normalize_ai_response(ai_result: Dict[str, Any], claim_text: str = "") -> Di
     original_summary = (ai_result.get('summary') or "").strip()
     combined_summary = original_summary or "Tidak ada ringkasan tersedia."
     
-    # Detect journal presence
-    has_journal = any(
-        (s.get('doi') or '').strip() or s.get('source_type') == 'journal'
-        for s in sources
-    )
+    # Detect journal presence (sources sudah dinormalisasi extract_sources: doi ter-strip)
+    has_journal = any(s['doi'] or s['source_type'] == 'journal' for s in sources)
     
     logger.info(f"[NORMALIZE] Raw label: {raw_label} (mapped: {mapped_label}), Confidence: {confidence:.2f}")
     logger.info(f"[NORMALIZE] Has journal: {has_journal}, Total sources: {len(sources)}")
@@ -272,6 +285,22 @@ def normalize_ai_response(ai_result: Dict[str, Any], claim_text: str = "") -> Di
     }
 
 
+def _excerpt(text: str, limit: int) -> str:
+    """
+    Sama dengan text.strip()[:limit], tapi hanya menyalin potongan yang disimpan
+    (snippet retriever bisa beberapa KB, yang dipakai cuma ratusan karakter).
+    """
+    match = _NON_SPACE_RE.search(text)
+    if match is None:
+        return ""
+    start = match.start()
+    stop = start + limit
+    piece = text[start:stop]
+    # Setelah potongan hanya tersisa whitespace -> ini ujung teks, buang spasi akhir
+    if _NON_SPACE_RE.search(text, stop) is None:
+        piece = piece.rstrip()
+    return piece
+
 def extract_sources(result: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Ekstrak sources dari result dictionary dengan normalisasi.
@@ -290,88 +319,95 @@ def extract_sources(result: Dict[str, Any]) -> List[Dict[str, Any]]:
         logger.warning(f"sources is not a list: {type(sources_raw)}")
         return []
     
+    # Satu pass: dedup (DOI / URL / safe_id sama) lalu langsung bangun objek output.
+    # Source tanpa DOI dicatat untuk validasi URL; url-nya ditimpa setelah validasi.
+    seen = set()
+    seen_add = seen.add
+    to_validate = []
     for src in sources_raw:
-        if not isinstance(src, dict):
+        if not src or not isinstance(src, dict):
             continue
-        
-        doi = (src.get("doi") or "").strip()
-        url = (src.get("url") or "").strip()
-        safe_id = (src.get("safe_id") or "").strip()
-
-        # Jika tidak ada DOI, lakukan cek ringan untuk menghindari link yang jelas-jelas 404/5xx
-        if not doi and url:
-            url = validate_url(url)
+        g = src.get
+        doi = (g("doi") or "").strip()
+        url = (g("url") or "").strip()
+        safe_id = (g("safe_id") or "").strip()
         
         # Minimal identifier supaya bisa dilacak di frontend / database
-        identifier = doi or url or safe_id
-        if not identifier:
+        key = doi or url or safe_id
+        if not key or key in seen:
             continue
-        
-        raw_title = src.get("title") or safe_id or "Unknown"
-        snippet = (src.get("snippet") or src.get("text") or "").strip()
-        if raw_title == "Unknown" and snippet:
-            raw_title = snippet[:80] + ("..." if len(snippet) > 80 else "")
-        
-        excerpt = snippet[:500]
+        seen_add(key)
+        
+        raw_title = g("title") or safe_id or "Unknown"
+        snippet = g("snippet") or g("text") or ""
+        excerpt = _excerpt(snippet, 500)
+        if raw_title == "Unknown" and excerpt:
+            raw_title = _excerpt(excerpt, 81)
+            if len(raw_title) > 80:
+                raw_title = raw_title[:80] + "..."
+        
+        # Skor dijepit ke [0, 1] (inline, tanpa panggilan min/max per source)
+        score = g("relevance_score")
+        if score is None:
+            score = g("relevance")
+        score = safe_float(score, default=0.0)
+        score = 0.0 if score < 0.0 else 1.0 if score > 1.0 else score
         
         source_obj = {
             "title": raw_title,
             "doi": doi,
             "url": (f"https://doi.org/{doi}" if doi else url),
-            "relevance_score": safe_float(
-                src.get("relevance_score", src.get("relevance", 0.0)),
-                default=0.0,
-            ),
+            "relevance_score": score,
             "excerpt": excerpt,
-            "source_type": src.get("source_type", "journal"),
+            "source_type": g("source_type", "journal"),
         }
-        
         sources.append(source_obj)
-    
-    # Urutkan dari yang paling relevan dan ambil maksimal 5 untuk ditampilkan di frontend
-    sources.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
-    return sources[:5]
-
-def load_training_env() -> Dict[str, str]:
-    """
-    Load environment variables dari training/.env dengan validation.
-    """
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(TRAINING_SCRIPTS_DIR)
-    
-    dotenv_path = TRAINING_DIR / ".env"
-    
-    if dotenv_path.exists():
-        try:
-            from dotenv import dotenv_values
-            env_vars = dotenv_values(dotenv_path)
-            
-            critical_keys = ["DEEPSEEK_API_KEY", "GEMINI_API_KEY", "DB_HOST", "DB_PORT", "DB_NAME", "DB_USER"]
-            missing_keys = [k for k in critical_keys if not env_vars.get(k)]
-            
-            if missing_keys:
-                logger.warning(f"⚠️  Missing keys in training/.env: {missing_keys}")
-            else:
-                logger.debug("✅ All critical env keys present")
-            
-            env.update({k: v for k, v in env_vars.items() if v is not None})
-            
-            logger.info(f"✅ Loaded .env from: {dotenv_path}")
-            logger.debug(f"   Keys loaded: {list(env_vars.keys())}")
-            
-        except ImportError:
-            logger.error("❌ python-dotenv not installed! Cannot load .env file")
-        except Exception as e:
-            logger.error(f"❌ Error loading .env: {e}")
-    else:
-        logger.warning(f"⚠️  .env not found at: {dotenv_path}")
-        logger.info("   Using environment variables from system")
-    
-    return env
+        
+        if not doi and url:
+            to_validate.append((source_obj, bool(safe_id)))
+    
+    # Jika tidak ada DOI, lakukan cek ringan untuk menghindari link yang jelas-jelas 404/5xx.
+    # HEAD request dijalankan paralel (I/O melepas GIL) sehingga latency = URL paling lambat.
+    # Setelah dedup, URL tanpa DOI sudah unik.
+    if to_validate:
+        urls = [obj["url"] for obj, _ in to_validate]
+        if len(urls) == 1:
+            checked = [validate_url(urls[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(URL_VALIDATION_MAX_WORKERS, len(urls)),
+                thread_name_prefix='validate-url'
+            ) as executor:
+                checked = list(executor.map(validate_url, urls))
+        
+        dead = set()
+        for (obj, has_safe_id), final_url in zip(to_validate, checked):
+            obj["url"] = final_url
+            # URL mati dan tidak ada safe_id -> tidak ada identifier tersisa
+            if not final_url and not has_safe_id:
+                dead.add(id(obj))
+        if dead:
+            sources = [obj for obj in sources if id(obj) not in dead]
+    
+    # Ambil maksimal 5 yang paling relevan untuk ditampilkan di frontend
+    return heapq.nlargest(MAX_RETURNED_SOURCES, sources, key=itemgetter("relevance_score"))
+
+def _strip_code_fence(text: str) -> str:
+    """Buang pembungkus Markdown ```json ... ``` dari output LLM."""
+    if not text.startswith('```'):
+        return text
+    body = text[3:]
+    close = body.find('```')
+    if close != -1:
+        body = body[:close]
+    if body.startswith('json'):
+        body = body[4:]
+    return body.strip()
 
 def parse_json_from_output(output: str) -> Optional[Dict[str, Any]]:
     """
     Parse JSON dari output dengan multiple fallback strategies.
+    orjson.JSONDecodeError adalah subclass ValueError.
     """
     if not output or not isinstance(output, str):
         return None
@@ -380,13 +416,13 @@ def parse_json_from_output(output: str) -> Optional[Dict[str, Any]]:
     
     # Strategy 1: Direct JSON parse
     try:
-        parsed = json.loads(output)
+        parsed = orjson.loads(output)
         if isinstance(parsed, list):
             if len(parsed) == 1 and isinstance(parsed[0], dict):
                 return parsed[0]
             return {"raw_data": parsed}
         return parsed
-    except json.JSONDecodeError:
+    except ValueError:
         pass
     
     # Strategy 2: Find JSON block in output
@@ -396,27 +432,36 @@ def parse_json_from_output(output: str) -> Optional[Dict[str, Any]]:
         
         if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
             json_str = output[start_idx:end_idx + 1]
-            parsed = json.loads(json_str)
+            parsed = orjson.loads(json_str)
             if isinstance(parsed, list):
                 if len(parsed) == 1 and isinstance(parsed[0], dict):
                     return parsed[0]
                 return {"raw_data": parsed}
             return parsed
-    except (json.JSONDecodeError, ValueError):
+    except ValueError:
         pass
     
-    # Strategy 3: Find JSON array
+    # Strategy 3: Objek JSON yang berisi objek nested (rfind('{') menunjuk ke objek dalam)
+    for candidate in reversed(_JSON_OBJECT_RE.findall(output)):
+        try:
+            parsed = orjson.loads(candidate)
+            if isinstance(parsed, dict):
+                return parsed
+        except ValueError:
+            continue
+    
+    # Strategy 4: Find JSON array
     try:
         start_idx = output.rfind('[')
         end_idx = output.rfind(']')
         
         if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
             json_str = output[start_idx:end_idx + 1]
-            parsed = json.loads(json_str)
+            parsed = orjson.loads(json_str)
             if isinstance(parsed, list) and len(parsed) == 1 and isinstance(parsed[0], dict):
                 return parsed[0]
             return {"raw_data": parsed}
-    except (json.JSONDecodeError, ValueError):
+    except ValueError:
         pass
     
     logger.warning("Failed to parse JSON from output")
@@ -448,26 +493,77 @@ def training_modules_available() -> bool:
 
 def get_optimized_module():
     """Lazy import optimized module."""
-    global _optimized_module
+    global _optimized_module, _optimized_module_error
+    
+    # Hot path: modul sudah dimuat (biasanya oleh warm_up_ai saat worker start)
+    if _optimized_module is not None:
+        return _optimized_module
     
     if not training_modules_available():
         raise ImportError("Training module dependencies not installed")
     
-    if _optimized_module is None:
-        if str(TRAINING_SCRIPTS_DIR) not in sys.path:
-            sys.path.insert(0, str(TRAINING_SCRIPTS_DIR))
-        
-        try:
-            import prompt_and_verify as pv
-            _optimized_module = pv
-            logger.info("✅ Loaded verification module (DeepSeek)")
-        except ImportError as e:
-            raise ImportError(f"Cannot import verification module: {e}")
+    if _optimized_module_error is not None:
+        raise ImportError(_optimized_module_error)
+    
+    if str(TRAINING_SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(TRAINING_SCRIPTS_DIR))
+    
+    try:
+        import prompt_and_verify as pv
+        _optimized_module = pv
+        logger.info("✅ Loaded verification module (DeepSeek)")
+    except ImportError as e:
+        _optimized_module_error = f"Cannot import verification module: {e}"
+        raise ImportError(_optimized_module_error)
     
     return _optimized_module
 
+def get_gemini_client():
+    """
+    Client Gemini per proses; None jika GEMINI_API_KEY tidak ada atau init gagal.
+    Dibuat ulang hanya jika API key berganti. Init dijaga lock karena bisa dipanggil
+    bersamaan dari thread request dan warm_up_ai di background.
+    """
+    global _gemini_client_entry
+    
+    api_key = os.getenv('GEMINI_API_KEY')
+    if not api_key:
+        logger.warning("GEMINI_API_KEY not found - Gemini features disabled")
+        return None
+    
+    entry = _gemini_client_entry
+    if entry is None or entry[0] != api_key:
+        with _gemini_client_lock:
+            entry = _gemini_client_entry
+            if entry is None or entry[0] != api_key:
+                try:
+                    from google import genai
+                    entry = (api_key, genai.Client(api_key=api_key))
+                except Exception as e:
+                    logger.error(f"Failed to initialize Gemini client: {e}")
+                    return None
+                _gemini_client_entry = entry
+    
+    return entry[1]
+
+def warm_up_ai() -> None:
+    """
+    Muat modul AI yang akan dipakai call_ai_verify (import berat) lebih awal,
+    supaya bisa dijalankan paralel dengan fetch evidence. Error diabaikan;
+    call_ai_verify tetap punya fallback sendiri.
+    """
+    try:
+        if training_modules_available() and VERIFY_SCRIPT.exists():
+            get_optimized_module()
+        elif os.getenv('GEMINI_API_KEY'):
+            get_gemini_client()
+        else:
+            from google import genai  # noqa: F401
+    except Exception as e:
+        logger.debug(f"AI warm-up skipped: {e}")
+
 def call_ai_verify_direct_optimized(claim_text: str) -> Dict[str, Any]:
-    """Call AI verification directly."""
+    """Call AI verification directly; hasil mentah dinormalisasi oleh normalize_ai_response."""
     start_time = time.time()
     
     try:
@@ -484,7 +580,8 @@ def call_ai_verify_direct_optimized(claim_text: str) -> Dict[str, Any]:
                 enable_expansion=True,
                 min_relevance=0.25,
                 force_dynamic_fetch=False,
-                debug_retrieval=False
+                debug_retrieval=False,
+                emit_json=False
             )
         else:
             raise AttributeError("verify_claim_local not found in module")
@@ -494,37 +591,17 @@ def call_ai_verify_direct_optimized(claim_text: str) -> Dict[str, Any]:
         logger.info(f"✅ Verification completed in {elapsed:.1f}s")
         
         # Extract from _frontend_payload if present (new format)
-        if "_frontend_payload" in raw_result:
-            payload = raw_result["_frontend_payload"]
-            logger.debug(f"[PARSE] Extracted from _frontend_payload: label={payload.get('label')}")
-        else:
-            payload = raw_result
-        
-        # Get label and map it
-        raw_label = payload.get("label", "unverified")
-        mapped_label = map_ai_label_to_backend(raw_label)
-        
-        # Get confidence
-        raw_confidence = payload.get("confidence")
-        confidence = float(raw_confidence) if raw_confidence is not None else 0.0
-        
-        # Get summary
-        summary = payload.get("summary", "") or payload.get("conclusion", "") or ""
-        
-        # Get sources from evidence or references
-        sources = extract_sources(payload)
-        
-        logger.info(f"[PARSE] Label: {raw_label} -> {mapped_label}, Confidence: {confidence}, Sources: {len(sources)}")
+        payload = raw_result.get("_frontend_payload", raw_result)
         
+        # Payload mentah dikembalikan apa adanya: label, confidence, dan sources
+        # dinormalisasi sekali oleh normalize_ai_response (dipanggil call_ai_verify)
         return {
-            "label": mapped_label,
-            "summary": summary,
-            "confidence": confidence,
-            "sources": sources,
+            **payload,
+            "label": payload.get("label") or "unverified",
+            "summary": payload.get("summary") or payload.get("conclusion") or "",
             "_processing_time": elapsed,
             "_method": "direct_optimized",
             "_claim_text": claim_text,
-            "_raw_label": raw_label
         }
         
     except Exception as e:
@@ -540,11 +617,6 @@ def call_ai_verify_direct_optimized(claim_text: str) -> Dict[str, Any]:
             "_processing_time": elapsed
         }
         
-def call_ai_verify_subprocess(claim_text: str) -> Dict[str, Any]:
-    """
-    Subprocess fallback method - fallback implementation.
-    """
-    raise NotImplementedError("Subprocess method not fully implemented - use direct method")
 # Public API
 
 def call_ai_verify(claim_text: str, additional_evidence: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -569,18 +641,9 @@ def call_ai_verify(claim_text: str, additional_evidence: Optional[Dict[str, Any]
             if result and result.get('label'):
                 return normalize_ai_response(result, claim_text)
         except Exception as e:
-            logger.warning(f"Direct import failed: {e}, trying subprocess...")
+            logger.warning(f"Direct import failed: {e}, using direct AI call...")
     
-    # Method 2: Subprocess (jika script ada tapi import gagal)
-    if VERIFY_SCRIPT.exists():
-        try:
-            result = call_ai_verify_subprocess(claim_text)
-            if result and result.get('label'):
-                return normalize_ai_response(result, claim_text)
-        except Exception as e:
-            logger.warning(f"Subprocess failed: {e}, using direct AI call...")
-    
-    # Method 3: Direct AI call (FALLBACK - SELALU TERSEDIA)
+    # Method 2: Direct AI call (FALLBACK - SELALU TERSEDIA)
     logger.info("Using direct AI call method")
     result = call_ai_direct(claim_text, additional_evidence)
     return normalize_ai_response(result, claim_text)
@@ -590,9 +653,6 @@ def call_ai_direct(claim_text: str, additional_evidence: Optional[Dict[str, Any]
     Direct call ke AI API tanpa menggunakan training script.
     Ini adalah fallback method yang selalu tersedia.
     """
-    import os
-    from google import genai
-    
     api_key = os.getenv('GEMINI_API_KEY')
     if not api_key:
         logger.error("GEMINI_API_KEY not set")
@@ -603,8 +663,6 @@ def call_ai_direct(claim_text: str, additional_evidence: Optional[Dict[str, Any]
             'sources': []
         }
     
-    client = genai.Client(api_key=api_key)
-    
     # Enhanced prompt for health claim verification
     prompt = f"""Kamu adalah ahli verifikasi klaim kesehatan. Verifikasi klaim berikut berdasarkan konsensus ilmiah dan jurnal medis.
 
@@ -628,6 +686,10 @@ Panduan label:
 Berikan analisis berdasarkan fakta ilmiah, bukan opini."""
 
     try:
+        client = get_gemini_client()
+        if client is None:
+            raise RuntimeError("Gemini client not available")
+        
         response = client.models.generate_content(
             model='gemini-2.0-flash',  
             contents=prompt,
@@ -637,18 +699,8 @@ Berikan analisis berdasarkan fakta ilmiah, bukan opini."""
             }
         )
         
-        # Parse JSON dari response
-        import json
-        result_text = response.text.strip()
-        
-        # Hapus markdown code block jika ada
-        if result_text.startswith('```'):
-            result_text = result_text.split('```')[1]
-            if result_text.startswith('json'):
-                result_text = result_text[4:]
-        
-        result = json.loads(result_text.strip())
-        return result
+        # Parse JSON dari response (hapus markdown code block jika ada)
+        return orjson.loads(_strip_code_fence(response.text.strip()))
         
     except Exception as e:
         logger.error(f"Direct AI call failed: {e}")
@@ -697,7 +749,8 @@ Abstrak/Konten:
             enable_expansion=True,
             min_relevance=0.2,  # Lower threshold untuk include evidence
             force_dynamic_fetch=False,
-            debug_retrieval=False
+            debug_retrieval=False,
+            emit_json=False
         )
         
         elapsed = time.time() - start_time
@@ -723,6 +776,4 @@ Abstrak/Konten:
         logger.error(f"[VERIFY_WITH_EVIDENCE] Error: {e}")
         raise
 logger.info(f"  Exists: {VERIFY_SCRIPT.exists()}")
-logger.info(f"  Timeout: {VERIFICATION_TIMEOUT}s")
-logger.info(f"  Max Retries: {MAX_RETRIES}")
 logger.info("="*80)
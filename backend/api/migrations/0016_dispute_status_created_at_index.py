@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 15:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_userreport'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dispute',
+            index=models.Index(fields=['status', '-created_at'], name='api_dispute_status_0952cb_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.30 on 2026-10-17 15:59
+
+import logging
+
+from django.db import migrations, models, transaction
+
+logger = logging.getLogger(__name__)
+
+# Trigram GIN index untuk Q(title__icontains) | Q(url__icontains) di AdminSourceListView.
+# Hanya untuk PostgreSQL; SQLite (dev/test) dilewati.
+TRGM_INDEXES = [
+    ('api_source_title_trgm', 'title'),
+    ('api_source_url_trgm', 'url'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+            for name, column in TRGM_INDEXES:
+                schema_editor.execute(
+                    f'CREATE INDEX IF NOT EXISTS {name} ON api_source '
+                    f'USING gin (UPPER({column}) gin_trgm_ops)'
+                )
+    except Exception as e:
+        # Tanpa hak CREATE EXTENSION, search tetap jalan (seq scan)
+        logger.warning(f"[MIGRATION] Skipping pg_trgm indexes: {e}")
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _ in TRGM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_dispute_status_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='source',
+            index=models.Index(fields=['doi'], name='api_source_doi_4713ae_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='source',
+            index=models.Index(fields=['url'], name='api_source_url_911fe3_idx'),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 4.2.30 on 2026-10-17 16:40
+
+import logging
+
+import django.contrib.postgres.search
+from django.db import migrations, transaction
+
+logger = logging.getLogger(__name__)
+
+# Full-text search untuk AdminSourceListView (websearch_to_tsquery).
+# Hanya untuk PostgreSQL; SQLite (dev/test) memakai fallback icontains.
+SEARCH_CONFIG = 'pg_catalog.english'
+
+CREATE_SQL = [
+    'CREATE INDEX IF NOT EXISTS api_source_search_vector_gin ON api_source USING gin (search_vector)',
+    'DROP TRIGGER IF EXISTS api_source_search_vector_update ON api_source',
+    f'CREATE TRIGGER api_source_search_vector_update BEFORE INSERT OR UPDATE OF title, url '
+    f'ON api_source FOR EACH ROW EXECUTE FUNCTION '
+    f"tsvector_update_trigger(search_vector, '{SEARCH_CONFIG}', title, url)",
+    # Backfill baris yang sudah ada
+    f"UPDATE api_source SET search_vector = to_tsvector('{SEARCH_CONFIG}', "
+    f"coalesce(title, '') || ' ' || coalesce(url, ''))",
+]
+
+DROP_SQL = [
+    'DROP TRIGGER IF EXISTS api_source_search_vector_update ON api_source',
+    'DROP INDEX IF EXISTS api_source_search_vector_gin',
+]
+
+
+def create_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with transaction.atomic(using=schema_editor.connection.alias):
+        for sql in CREATE_SQL:
+            schema_editor.execute(sql)
+    logger.info("[MIGRATION] Source search_vector trigger and GIN index created")
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for sql in DROP_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_source_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='source',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 17:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_source_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='source',
+            index=models.Index(fields=['-created_at', '-id'], name='api_source_created_3d6fc1_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 17:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0019_source_created_at_id_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['-created_at'], name='api_claim_created_1f2810_idx'),
+        ),
+    ]
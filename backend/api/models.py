@@ -1,5 +1,6 @@
 import logging
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from .text_normalization import normalize_claim_text, generate_semantic_hash
 
@@ -31,9 +32,22 @@ class Source(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    # Diisi trigger PostgreSQL dari title + url (migration 0018); NULL di SQLite
+    search_vector = SearchVectorField(null=True, editable=False)
     
     def __str__(self):
         return f"{self.title} ({self.doi or self.url or 'no-id'})"
+
+    class Meta:
+        # Trigram GIN index untuk pencarian icontains (title/url) dan GIN index
+        # search_vector dibuat langsung di migration 0017/0018 karena khusus PostgreSQL.
+        indexes = [
+            models.Index(fields=['doi']),
+            models.Index(fields=['url']),
+            # Keyset pagination daftar source admin (created_at, id)
+            models.Index(fields=['-created_at', '-id']),
+        ]
         
 # menyimpan klaim yang dikirim untuk diverifikasi
 class Claim(models.Model):
@@ -70,6 +84,8 @@ class Claim(models.Model):
         indexes = [
             models.Index(fields=['text_hash']),
             models.Index(fields=['text_normalized']),
+            # Daftar klaim & recent activity dashboard diurutkan -created_at
+            models.Index(fields=['-created_at']),
         ]
     
 # Model hubungan antara claim dan sumber
@@ -236,6 +252,9 @@ class Dispute(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Dispute'
         verbose_name_plural = 'Disputes'
+        indexes = [
+            models.Index(fields=['status', '-created_at']),
+        ]
     
     def __str__(self):
         return f"Dispute #{self.id} - {self.status}"
@@ -0,0 +1,25 @@
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Fallback untuk tipe yang tidak dikenal orjson (Decimal, lazy string, QuerySet, dll)
+_FALLBACK_ENCODER = JSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer berbasis orjson.
+
+    datetime/date/UUID diserialisasi langsung oleh orjson (RFC 3339),
+    sehingga view cukup mengembalikan hasil values() tanpa .isoformat().
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    options = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=_FALLBACK_ENCODER.default, option=self.options)
@@ -0,0 +1,45 @@
+import logging
+
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Claim, Dispute, Source, VerificationResult
+
+logger = logging.getLogger(__name__)
+
+# Cache key & TTL untuk statistik dashboard admin
+DASHBOARD_STATS_CACHE_KEY = 'admin:dashboard:stats'
+DASHBOARD_STATS_CACHE_TIMEOUT = 30
+
+# Cache key & TTL untuk statistik sources admin
+SOURCE_STATS_CACHE_KEY = 'admin:sources:stats'
+SOURCE_STATS_CACHE_TIMEOUT = 60
+# ETag tabel Source untuk conditional GET admin (diinvalidasi bersama statistik)
+SOURCE_TABLE_ETAG_CACHE_KEY = 'admin:sources:etag'
+
+
+@receiver(post_save, sender=Claim)
+@receiver(post_delete, sender=Claim)
+@receiver(post_save, sender=Dispute)
+@receiver(post_delete, sender=Dispute)
+@receiver(post_save, sender=Source)
+@receiver(post_delete, sender=Source)
+@receiver(post_save, sender=VerificationResult)
+@receiver(post_delete, sender=VerificationResult)
+def invalidate_dashboard_stats(sender, **kwargs):
+    """Hapus cache statistik dashboard setiap kali data yang dihitung berubah."""
+    try:
+        cache.delete(DASHBOARD_STATS_CACHE_KEY)
+    except Exception as e:
+        logger.warning(f"[DASHBOARD_CACHE] Failed to invalidate cache: {e}")
+
+
+@receiver(post_save, sender=Source)
+@receiver(post_delete, sender=Source)
+def invalidate_source_stats(sender, **kwargs):
+    """Hapus cache statistik & ETag sources setiap kali tabel Source berubah."""
+    try:
+        cache.delete_many([SOURCE_STATS_CACHE_KEY, SOURCE_TABLE_ETAG_CACHE_KEY])
+    except Exception as e:
+        logger.warning(f"[SOURCE_STATS_CACHE] Failed to invalidate cache: {e}")
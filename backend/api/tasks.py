@@ -0,0 +1,82 @@
+import logging
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+# Worker pool bersama untuk pekerjaan berat (fetch evidence, AI verify, journal search)
+# agar tidak memblokir thread request HTTP.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'BACKGROUND_TASK_WORKERS', 4),
+    thread_name_prefix='api-task'
+)
+
+# Status job disimpan di cache agar bisa di-poll via /api/admin/jobs/<id>/
+JOB_CACHE_TIMEOUT = 60 * 60
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+
+
+def _job_cache_key(job_id: str) -> str:
+    return f'api:job:{job_id}'
+
+
+def run_in_background(func, *args, **kwargs) -> Future:
+    """
+    Jalankan func(*args, **kwargs) di worker pool.
+    Koneksi DB milik worker ditutup setelah task selesai.
+    """
+    def _runner():
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"[TASK] {getattr(func, '__name__', func)} failed: {str(e)}", exc_info=True)
+            return None
+        finally:
+            close_old_connections()
+
+    return _EXECUTOR.submit(_runner)
+
+
+def enqueue_on_commit(func, *args, **kwargs) -> None:
+    """
+    Jadwalkan task setelah transaksi aktif berhasil commit,
+    sehingga worker selalu membaca data yang sudah tersimpan.
+    """
+    transaction.on_commit(lambda: run_in_background(func, *args, **kwargs))
+
+
+def create_job(kind: str, **meta) -> str:
+    """Daftarkan job baru berstatus queued dan kembalikan job id-nya."""
+    job_id = uuid.uuid4().hex
+    cache.set(_job_cache_key(job_id), {
+        'job_id': job_id,
+        'kind': kind,
+        'status': JOB_QUEUED,
+        'result': None,
+        'error': None,
+        **meta,
+    }, timeout=JOB_CACHE_TIMEOUT)
+    return job_id
+
+
+def update_job(job_id: str, **fields) -> None:
+    """Perbarui status/result job; diabaikan jika entry sudah expired."""
+    key = _job_cache_key(job_id)
+    job = cache.get(key)
+    if job is None:
+        return
+    job.update(fields)
+    cache.set(key, job, timeout=JOB_CACHE_TIMEOUT)
+
+
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    return cache.get(_job_cache_key(job_id))
@@ -1,9 +1,11 @@
+import json
 import tempfile
 from io import StringIO
 from pathlib import Path
 from unittest.mock import patch
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.management import call_command
 from django.test import TestCase
 from django.test import override_settings
@@ -284,6 +286,35 @@ class AdminViewsTests(TestCase):
         self.assertEqual(stats["total_sources"], 1)
         self.assertEqual(stats["verified_claims"], 1)
 
+        activity = resp.json()["recent_activity"]
+        claim_activity = [a for a in activity if a["type"] == "claim"]
+        self.assertTrue(claim_activity[0]["text"].startswith("Verified claim (valid)"))
+        self.assertEqual(len([a for a in activity if a["type"] == "dispute"]), 1)
+
+    def test_admin_dashboard_stats_query_budget(self):
+        from api.admin_views import AdminDashboardStatsView
+        claim = Claim.objects.create(text="Test claim")
+        VerificationResult.objects.create(claim=claim, label=VerificationResult.LABEL_VALID, summary="s", confidence=0.8)
+
+        # Claim (total+verified) + Dispute (pending) + Source + UNION recent activity
+        with self.assertNumQueries(4) as ctx:
+            stats = AdminDashboardStatsView()._compute_stats()["stats"]
+        self.assertEqual(stats["verified_claims"], 1)
+        self.assertFalse(any("DISTINCT" in q["sql"].upper() for q in ctx.captured_queries))
+
+    def test_admin_dashboard_recent_activity_sorted_and_limited(self):
+        for i in range(6):
+            claim = Claim.objects.create(text=f"Claim nomor {i}")
+            Dispute.objects.create(claim=claim, claim_text=claim.text, reason="Alasan panjang untuk dispute.")
+
+        self.client.force_authenticate(user=self.staff_user)
+        resp = self.client.get(reverse("admin-dashboard-stats"))
+        self.assertEqual(resp.status_code, 200)
+        activity = resp.json()["recent_activity"]
+        self.assertEqual(len(activity), 8)
+        times = [a["time"] for a in activity]
+        self.assertEqual(times, sorted(times, reverse=True))
+
     def test_admin_user_list_requires_superadmin(self):
         url = reverse("admin-user-list")
         self.client.force_authenticate(user=self.staff_user)
@@ -312,7 +343,34 @@ class AdminViewsTests(TestCase):
             format="json",
         )
         self.assertEqual(resp.status_code, 201)
-        self.assertTrue(User.objects.filter(username="admin2", is_staff=True).exists())
+        self.assertEqual(resp.json()["admin"]["username"], "admin2")
+        self.assertIsNone(resp.json()["admin"]["last_login"])
+        created = User.objects.get(username="admin2", is_staff=True)
+        self.assertTrue(created.check_password("pass12345"))
+
+    def test_admin_user_bulk_create(self):
+        url = reverse("admin-user-list")
+        self.client.force_authenticate(user=self.superuser)
+        payload = [
+            {"username": f"batch{i}", "email": f"batch{i}@x.com", "password": "pass12345"}
+            for i in range(3)
+        ]
+        resp = self.client.post(url, data=payload, format="json")
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(len(resp.json()["admins"]), 3)
+        created = User.objects.get(username="batch2")
+        self.assertTrue(created.is_staff)
+        self.assertFalse(created.is_superuser)
+        self.assertTrue(created.check_password("pass12345"))
+
+        # Username yang sudah ada -> seluruh batch ditolak
+        resp = self.client.post(url, data=[
+            {"username": "batch0", "email": "b@x.com", "password": "pass12345"},
+            {"username": "batch9", "email": "c@x.com", "password": "pass12345"},
+        ], format="json")
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json()["usernames"], ["batch0"])
+        self.assertFalse(User.objects.filter(username="batch9").exists())
 
     def test_admin_user_detail_not_found(self):
         url = reverse("admin-user-detail", kwargs={"user_id": 99999})
@@ -341,9 +399,32 @@ class AdminViewsTests(TestCase):
 
         url = reverse("admin-dispute-list") + "?status=pending"
         self.client.force_authenticate(user=self.staff_user)
-        resp = self.client.get(url)
+        # Halaman tidak penuh: total dari jumlah baris, tanpa SELECT COUNT
+        with self.assertNumQueries(1):
+            resp = self.client.get(url)
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(resp.json()["total"], 1)
+        row = resp.json()["disputes"][0]
+        pending = Dispute.objects.get(status=Dispute.STATUS_PENDING)
+        self.assertEqual(row["claim_id"], claim.id)
+        self.assertEqual(row["status_display"], pending.get_status_display())
+        self.assertEqual(row["created_at"], pending.created_at.isoformat())
+        self.assertIsNone(row["reviewed_by"])
+        self.assertNotIn("reviewer_username", row)
+        self.assertFalse(row["supporting_file"])
+
+    def test_admin_dispute_list_pagination(self):
+        claim = Claim.objects.create(text="Test claim")
+        for _ in range(3):
+            Dispute.objects.create(claim=claim, claim_text=claim.text, reason="Alasan panjang untuk dispute.")
+
+        self.client.force_authenticate(user=self.staff_user)
+        resp = self.client.get(reverse("admin-dispute-list") + "?page=2&per_page=2")
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()
+        self.assertEqual(len(data["disputes"]), 1)
+        self.assertEqual(data["total"], 3)
+        self.assertEqual(data["pagination"]["total_pages"], 2)
 
     def test_admin_dispute_detail_get_not_found(self):
         url = reverse("admin-dispute-detail", kwargs={"dispute_id": 99999})
@@ -425,14 +506,162 @@ class AdminViewsTests(TestCase):
         url = reverse("admin-dispute-detail", kwargs={"dispute_id": dispute.id})
         self.client.force_authenticate(user=self.staff_user)
         with (
-            patch("api.admin_views.AdminDisputeDetailView._trigger_pipeline", return_value=None),
-            patch("api.admin_views.call_ai_verify", return_value={"label": "hoax", "confidence": 0.9, "summary": "x"}),
-            patch("api.admin_views.normalize_ai_response", return_value={"label": "hoax", "confidence": 0.9, "summary": "x"}),
+            patch("api.admin_views.run_in_background") as mocked_pipeline,
+            patch("api.tasks.run_in_background", side_effect=lambda func, *args: func(*args)),
+            patch("api.admin_views.call_ai_verify", return_value={"label": "hoax", "confidence": 0.9, "summary": "x"}) as mocked_ai,
+            patch("api.admin_views.normalize_ai_response", return_value={"label": "hoax", "confidence": 0.9, "summary": "x", "sources": []}),
+            self.captureOnCommitCallbacks(execute=True),
         ):
             resp = self.client.post(url, data={"action": "approve", "re_verify": True}, format="json")
-        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.status_code, 202)
+        self.assertEqual(resp.data["updated_via"], "ai_reverify_queued")
+        self.assertEqual(resp.data["job_status"], "queued")
+        # Label sebelum re-verify tidak dikirim; hasil baru di-poll lewat job
+        self.assertIsNone(resp.data["verification_update"])
         vr = VerificationResult.objects.get(claim=claim)
         self.assertEqual(vr.label, VerificationResult.LABEL_HOAX)
+        # Setelah re-verify sukses hanya pencarian jurnal yang dijadwalkan (tanpa AI kedua)
+        from api.admin_views import fetch_similar_journals_task
+        mocked_pipeline.assert_called_once_with(fetch_similar_journals_task, claim.id)
+        mocked_ai.assert_called_once()
+
+        job_resp = self.client.get(reverse("admin-job-status", kwargs={"job_id": resp.data["job_id"]}))
+        self.assertEqual(job_resp.status_code, 200)
+        self.assertEqual(job_resp.data["status"], "done")
+        self.assertEqual(job_resp.data["result"]["updated_via"], "ai_reverify")
+
+    def test_admin_job_status_unknown(self):
+        self.client.force_authenticate(user=self.staff_user)
+        resp = self.client.get(reverse("admin-job-status", kwargs={"job_id": "missing"}))
+        self.assertEqual(resp.status_code, 404)
+
+    def test_admin_dispute_approve_schedules_pipeline_on_commit(self):
+        from api.admin_views import process_dispute_pipeline
+
+        claim = Claim.objects.create(text="Test claim")
+        VerificationResult.objects.create(claim=claim, label=VerificationResult.LABEL_UNCERTAIN, summary="s", confidence=0.6)
+        dispute = Dispute.objects.create(
+            claim=claim,
+            claim_text=claim.text,
+            reason="Alasan panjang untuk dispute.",
+            status=Dispute.STATUS_PENDING,
+        )
+
+        url = reverse("admin-dispute-detail", kwargs={"dispute_id": dispute.id})
+        self.client.force_authenticate(user=self.staff_user)
+        with (
+            patch("api.tasks.run_in_background") as mocked_bg,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            resp = self.client.post(
+                url,
+                data={"action": "approve", "manual_update": True, "re_verify": False, "new_label": "hoax", "new_confidence": 0.2},
+                format="json",
+            )
+        self.assertEqual(resp.status_code, 200)
+        mocked_bg.assert_called_once_with(process_dispute_pipeline, dispute.id, None)
+
+    def test_admin_dispute_approve_fetches_evidence_once(self):
+        claim = Claim.objects.create(text="Test claim")
+        dispute = Dispute.objects.create(
+            claim=claim,
+            claim_text=claim.text,
+            reason="Alasan panjang untuk dispute.",
+            supporting_doi="10.1000/once",
+            status=Dispute.STATUS_PENDING,
+        )
+        evidence = {"title": "Paper", "doi": "10.1000/once", "url": "https://doi.org/10.1000/once", "abstract": ""}
+
+        url = reverse("admin-dispute-detail", kwargs={"dispute_id": dispute.id})
+        self.client.force_authenticate(user=self.staff_user)
+        with (
+            patch("api.admin_views.fetch_evidence_from_doi", return_value=evidence) as mocked_fetch,
+            patch("api.admin_views.call_ai_verify", return_value={"label": "hoax", "confidence": 0.9, "summary": "x"}),
+            patch("api.admin_views.run_in_background"),
+            patch("api.tasks.run_in_background", side_effect=lambda func, *args: func(*args)),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            resp = self.client.post(
+                url,
+                data={"action": "approve", "manual_update": True, "re_verify": False, "new_label": "hoax", "new_confidence": 0.2},
+                format="json",
+            )
+        self.assertEqual(resp.status_code, 200)
+        # Manual approve + pipeline memakai hasil fetch yang sama
+        mocked_fetch.assert_called_once_with("10.1000/once")
+        self.assertTrue(ClaimSource.objects.filter(claim=claim, source__doi="10.1000/once").exists())
+
+    def test_admin_dispute_approve_manual_creates_missing_verification(self):
+        claim = Claim.objects.create(text="Klaim tanpa hasil verifikasi")
+        dispute = Dispute.objects.create(claim=claim, claim_text=claim.text, reason="Alasan panjang untuk dispute.")
+
+        url = reverse("admin-dispute-detail", kwargs={"dispute_id": dispute.id})
+        self.client.force_authenticate(user=self.staff_user)
+        with patch("api.tasks.run_in_background"):
+            resp = self.client.post(
+                url,
+                data={"action": "approve", "manual_update": True, "re_verify": False,
+                      "new_label": "valid", "new_confidence": 0.9, "new_summary": "ok"},
+                format="json",
+            )
+        self.assertEqual(resp.status_code, 200)
+        vr = VerificationResult.objects.get(claim=claim)
+        self.assertEqual(vr.label, "valid")
+        self.assertEqual(vr.summary, "ok")
+        self.assertIn(f"dispute #{dispute.id}", vr.reviewer_notes)
+
+    def test_admin_dispute_approve_sends_single_email(self):
+        claim = Claim.objects.create(text="Test claim")
+        dispute = Dispute.objects.create(
+            claim=claim,
+            claim_text=claim.text,
+            reason="Alasan panjang untuk dispute.",
+            reporter_email="user@example.com",
+        )
+
+        url = reverse("admin-dispute-detail", kwargs={"dispute_id": dispute.id})
+        self.client.force_authenticate(user=self.staff_user)
+        with (
+            patch("api.admin_views.email_service.notify_user_dispute_approved", return_value=True) as mocked_send,
+            patch("api.admin_views.process_dispute_pipeline"),
+            patch("api.tasks.run_in_background", side_effect=lambda func, *args: func(*args)),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            resp = self.client.post(
+                url,
+                data={"action": "approve", "manual_update": True, "re_verify": False,
+                      "new_label": "valid", "new_confidence": 0.9, "review_note": "ok"},
+                format="json",
+            )
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.json()["email_queued"])
+        mocked_send.assert_called_once()
+
+    def test_admin_dispute_reject_queues_single_email_on_commit(self):
+        from api.admin_views import send_dispute_decision_email
+
+        claim = Claim.objects.create(text="Test claim")
+        dispute = Dispute.objects.create(
+            claim=claim,
+            claim_text=claim.text,
+            reason="Alasan panjang untuk dispute.",
+            reporter_email="user@example.com",
+        )
+
+        url = reverse("admin-dispute-detail", kwargs={"dispute_id": dispute.id})
+        self.client.force_authenticate(user=self.staff_user)
+        with (
+            patch("api.tasks.run_in_background") as mocked_bg,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            resp = self.client.post(url, data={"action": "reject", "review_note": "no"}, format="json")
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.json()["email_queued"])
+        mocked_bg.assert_called_once_with(send_dispute_decision_email, dispute.id, Dispute.STATUS_REJECTED, "no")
+
+        with patch("api.admin_views.email_service.notify_user_dispute_rejected", return_value=True) as mocked_send:
+            self.assertTrue(send_dispute_decision_email(dispute.id, Dispute.STATUS_REJECTED, "no"))
+        mocked_send.assert_called_once()
 
     def test_admin_dispute_reject(self):
         claim = Claim.objects.create(text="Test claim")
@@ -450,6 +679,13 @@ class AdminViewsTests(TestCase):
         self.assertEqual(resp.status_code, 200)
         dispute.refresh_from_db()
         self.assertEqual(dispute.status, Dispute.STATUS_REJECTED)
+        self.assertTrue(dispute.reviewed)
+        self.assertEqual(dispute.reviewed_by, self.staff_user)
+        self.assertEqual(dispute.review_note, "no")
+
+        # Review kedua ditolak karena dispute sudah tidak pending
+        resp = self.client.post(url, data={"action": "approve"}, format="json")
+        self.assertEqual(resp.status_code, 400)
 
     def test_admin_sources_crud_and_stats(self):
         self.client.force_authenticate(user=self.staff_user)
@@ -488,40 +724,119 @@ class AdminViewsTests(TestCase):
         resp = self.client.delete(detail_url)
         self.assertEqual(resp.status_code, 200)
 
+        # Cache stats di-invalidate oleh signal saat source dihapus
+        resp = self.client.get(stats_url)
+        self.assertEqual(resp.json()["total_sources"], 0)
+
 
 class EvidenceFetchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
     def test_fetch_evidence_from_doi_normalizes_url(self):
         from api import admin_views
 
         class DummyResp:
-            status_code = 200
-
-            def json(self):
-                return {
-                    "message": {
-                        "title": ["Title A"],
-                        "abstract": "<jats:p>Abstract</jats:p>",
-                        "author": [{"given": "A", "family": "B"}],
-                        "publisher": "P",
-                    }
+            status = 200
+            data = json.dumps({
+                "message": {
+                    "title": ["Title A"],
+                    "abstract": "<jats:p>Abstract</jats:p>",
+                    "author": [{"given": "A", "family": "B"}],
+                    "publisher": "P",
                 }
+            }).encode()
 
-        with patch("api.admin_views.requests.get", return_value=DummyResp()):
+        with patch("api.admin_views._CROSSREF_POOL.request", return_value=DummyResp()):
             data = admin_views.fetch_evidence_from_doi("https://doi.org/10.1000/test")
         self.assertEqual(data["doi"], "10.1000/test")
         self.assertEqual(data["title"], "Title A")
         self.assertIn("Abstract", data["abstract"])
 
+    def test_fetch_evidence_from_doi_is_cached(self):
+        from api import admin_views
+
+        class DummyResp:
+            status = 200
+            data = json.dumps({"message": {"title": ["Cached Title"]}}).encode()
+
+        with patch("api.admin_views._CROSSREF_POOL.request", return_value=DummyResp()) as mocked_get:
+            first = admin_views.fetch_evidence_from_doi("10.1000/ABC")
+            second = admin_views.fetch_evidence_from_doi(" https://doi.org/10.1000/abc ")
+        self.assertEqual(mocked_get.call_count, 1)
+        self.assertEqual(first["title"], "Cached Title")
+        self.assertEqual(second["title"], "Cached Title")
+
+    def test_fetch_evidence_stale_entry_served_and_refreshed(self):
+        from api import admin_views
+
+        cache_key = admin_views._evidence_cache_key("doi", "10.1000/stale")
+        cache.set(cache_key, (0, {"doi": "10.1000/stale", "title": "Old"}), 60)
+
+        with patch("api.admin_views.run_in_background") as mocked_bg, \
+                patch("api.admin_views._CROSSREF_POOL.request") as mocked_request:
+            first = admin_views.fetch_evidence_from_doi("10.1000/stale")
+            second = admin_views.fetch_evidence_from_doi("10.1000/stale")
+        self.assertEqual(first["title"], "Old")
+        self.assertEqual(second["title"], "Old")
+        mocked_request.assert_not_called()
+        # Refresh hanya dijadwalkan sekali selama lock aktif
+        self.assertEqual(mocked_bg.call_count, 1)
+
+    def test_fetch_dispute_evidence_prefers_doi(self):
+        from api import admin_views
+
+        dispute = Dispute(supporting_doi="10.1/doi", supporting_url="https://example.com")
+        with patch("api.admin_views.fetch_evidence_from_doi", return_value={"doi": "10.1/doi"}) as mocked_doi, \
+                patch("api.admin_views.fetch_evidence_from_url") as mocked_url:
+            evidence = admin_views.fetch_dispute_evidence(dispute)
+        self.assertEqual(evidence, {"doi": "10.1/doi"})
+        mocked_doi.assert_called_once_with("10.1/doi")
+        mocked_url.assert_not_called()
+
     def test_fetch_evidence_from_url_parses_title(self):
         from api import admin_views
 
         class DummyResp:
             status_code = 200
-            text = "<html><head><title>Hello</title><meta name='description' content='desc'></head></html>"
+            encoding = "utf-8"
+
+            def __init__(self, chunks):
+                self.chunks = chunks
+                self.consumed = 0
 
-        with patch("api.admin_views.requests.get", return_value=DummyResp()):
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def iter_content(self, chunk_size=1):
+                for chunk in self.chunks:
+                    self.consumed += 1
+                    yield chunk
+
+        resp = DummyResp([b"<html><head><title>Hello</title><meta name='description' content='desc'></head></html>"])
+        with patch("api.admin_views._HTTP.get", return_value=resp):
             data = admin_views.fetch_evidence_from_url("https://example.com")
         self.assertEqual(data["title"], "Hello")
+        self.assertEqual(data["abstract"], "desc")
+
+        # Berhenti membaca setelah title + description ditemukan
+        resp = DummyResp([b"<html><head><tit", b"le>Split</title><meta name='description' content='d2'>", b"<body>" * 10])
+        with patch("api.admin_views._HTTP.get", return_value=resp):
+            data = admin_views.fetch_evidence_from_url("https://example.com/split")
+        self.assertEqual(data["title"], "Split")
+        self.assertEqual(resp.consumed, 2)
+
+        # Karakter multibyte terpotong antar chunk tetap utuh; </HEAD> menghentikan scan
+        encoded = "<title>Kesehatan é</title>".encode("utf-8")
+        split_at = encoded.index("é".encode("utf-8")) + 1
+        resp = DummyResp([encoded[:split_at], encoded[split_at:], b"</HEAD>", b"<body>" * 10])
+        with patch("api.admin_views._HTTP.get", return_value=resp):
+            data = admin_views.fetch_evidence_from_url("https://example.com/utf8")
+        self.assertEqual(data["title"], "Kesehatan é")
+        self.assertEqual(resp.consumed, 3)
 
 
 class EmailServiceTests(TestCase):
@@ -762,6 +1077,42 @@ class DisputeViewsExtendedTests(TestCase):
         self.assertEqual(dispute.original_label, VerificationResult.LABEL_UNCERTAIN)
         self.assertEqual(dispute.original_confidence, 0.6)
 
+    def test_dispute_create_unverified_claim_has_no_original(self):
+        claim = Claim.objects.create(text="Klaim belum diverifikasi")
+
+        url = reverse("dispute-create")
+        payload = {
+            "claim_id": claim.id,
+            "reason": "Alasan panjang untuk dispute yang valid.",
+        }
+
+        with patch("api.views.email_service.notify_admin_new_dispute", return_value=True):
+            resp = self.client.post(url, data=payload, format="json")
+
+        self.assertEqual(resp.status_code, 201)
+        dispute = Dispute.objects.get(id=resp.json()["id"])
+        self.assertEqual(dispute.claim_id, claim.id)
+        self.assertEqual(dispute.original_label, "")
+        self.assertIsNone(dispute.original_confidence)
+
+    def test_dispute_create_notifies_admin_in_background(self):
+        url = reverse("dispute-create")
+        payload = {
+            "claim_text": "Klaim tanpa pasangan",
+            "reason": "Alasan panjang untuk dispute yang valid.",
+        }
+
+        with (
+            patch("api.views.email_service.notify_admin_new_dispute", return_value=True) as mocked_notify,
+            patch("api.tasks.run_in_background", side_effect=lambda func, *args: func(*args)) as mocked_bg,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            resp = self.client.post(url, data=payload, format="json")
+
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(mocked_bg.call_args.args[1], resp.json()["id"])
+        self.assertEqual(mocked_notify.call_args.args[0].id, resp.json()["id"])
+
     def test_dispute_create_autolinks_by_similarity(self):
         claim = Claim.objects.create(text="Vitamin C membantu imunitas tubuh")
         claim.status = Claim.STATUS_DONE
@@ -784,7 +1135,8 @@ class DisputeViewsExtendedTests(TestCase):
         dispute = Dispute.objects.create(claim=claim, claim_text=claim.text, reason="Alasan panjang untuk dispute.")
 
         list_url = reverse("dispute-list")
-        resp = self.client.get(list_url)
+        with self.assertNumQueries(1):
+            resp = self.client.get(list_url)
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(resp.json()["total"], 1)
 
@@ -805,6 +1157,24 @@ class JournalAdminViewsTests(TestCase):
         )
         self.client.force_authenticate(user=self.admin)
 
+    def test_admin_journal_list_query_count_is_constant(self):
+        from api.models import JournalArticle
+
+        for i in range(5):
+            JournalArticle.objects.create(
+                title=f"J{i}", abstract="abs", doi=f"10.1000/q{i}",
+                embedding="[0.1, 0.2]", created_by=self.admin,
+            )
+
+        # 1 COUNT + 1 SELECT (created_by di-join)
+        with self.assertNumQueries(2):
+            resp = self.client.get(reverse("admin-journal-list"))
+        self.assertEqual(resp.status_code, 200)
+        rows = resp.json()["journals"]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]["created_by_name"], self.admin.username)
+        self.assertNotIn("embedding", rows[0])
+
     def test_admin_journal_crud_and_embed(self):
         from api.models import JournalArticle
 
@@ -981,7 +1351,9 @@ class ViewsLabelAndCacheTests(TestCase):
         claim2.save()
         VerificationResult.objects.create(claim=claim2, label=VerificationResult.LABEL_VALID, summary="s", confidence=0.9)
 
-        ok, cached_claim, vr = check_cached_result("X")
+        with self.assertNumQueries(1):
+            ok, cached_claim, vr = check_cached_result("X")
+            self.assertEqual(vr.claim_id, cached_claim.id)
         self.assertTrue(ok)
         self.assertIsNotNone(cached_claim)
         self.assertEqual(vr.label, VerificationResult.LABEL_VALID)
@@ -1251,6 +1623,36 @@ class AdminInternalMethodTests(TestCase):
         view._add_user_evidence_as_source(claim, evidence_exist)
         self.assertTrue(claim.sources.filter(id=existing.id).exists())
 
+        # Dipanggil ulang: link yang sama tidak diduplikasi
+        view._add_user_evidence_as_source(claim, evidence_exist)
+        self.assertEqual(ClaimSource.objects.filter(claim=claim, source=existing).count(), 1)
+
+    def test_summary_preview_truncates_long_text_only(self):
+        from api.admin_views import _summary_preview
+        self.assertIsNone(_summary_preview(None))
+        self.assertEqual(_summary_preview("x" * 200), "x" * 200)
+        self.assertEqual(_summary_preview("x" * 201), "x" * 200 + "...")
+
+    def test_reverify_with_ai_failure_writes_fallback_once(self):
+        from api.admin_views import AdminDisputeDetailView, _write_verification
+        claim = Claim.objects.create(text="Klaim reverify")
+        vr = VerificationResult.objects.create(claim=claim, label=VerificationResult.LABEL_UNCERTAIN, summary="s", confidence=0.5)
+        dispute = Dispute.objects.create(claim=claim, claim_text=claim.text, reason="Alasan panjang untuk dispute.")
+
+        with (
+            patch("api.admin_views.call_ai_verify", side_effect=RuntimeError("down")),
+            patch("api.admin_views._write_verification", side_effect=_write_verification) as mocked_write,
+        ):
+            outcome = AdminDisputeDetailView()._reverify_with_ai(
+                dispute, vr, "note", manual_update=True, new_label="hoax", new_confidence=0.3
+            )
+
+        self.assertEqual(outcome["updated_via"], "manual_fallback")
+        self.assertEqual(mocked_write.call_count, 1)
+        vr.refresh_from_db()
+        self.assertEqual(vr.label, "hoax")
+        self.assertIn("AI re-verify failed", vr.reviewer_notes)
+
     def test_update_claim_sources_returns_true_and_sets_rank(self):
         from api.admin_views import AdminDisputeDetailView
         from api.models import Claim
@@ -1267,6 +1669,45 @@ class AdminInternalMethodTests(TestCase):
         self.assertEqual(links[0].rank, 0)
         self.assertEqual(links[1].rank, 1)
 
+    def test_update_claim_sources_reuses_existing_and_skips_duplicates(self):
+        from api.admin_views import AdminDisputeDetailView
+        from api.models import Claim, Source
+        claim = Claim.objects.create(text="Klaim bulk")
+        existing = Source.objects.create(title="Old", doi="10.5/old")
+        new_sources = [
+            {"title": "Old", "doi": "10.5/old", "relevance_score": 0.9},
+            {"title": "New", "doi": "10.5/new", "relevance_score": 0.7},
+            {"title": "New dup", "doi": "10.5/new", "relevance_score": 0.6},
+            {"title": "Third", "doi": "10.5/third", "relevance_score": 0.5},
+        ]
+        ok = AdminDisputeDetailView()._update_claim_sources(claim, new_sources)
+        self.assertTrue(ok)
+        self.assertEqual(Source.objects.filter(doi="10.5/new").count(), 1)
+        links = list(ClaimSource.objects.filter(claim=claim).order_by('rank'))
+        self.assertEqual([link.source.doi for link in links], ["10.5/old", "10.5/new", "10.5/third"])
+        self.assertEqual(links[0].source_id, existing.id)
+        # Rank berurutan tanpa celah meskipun ada duplikat di tengah batch
+        self.assertEqual([link.rank for link in links], [0, 1, 2])
+
+    def test_update_claim_sources_upserts_links_in_place(self):
+        from api.admin_views import AdminDisputeDetailView
+        claim = Claim.objects.create(text="Klaim upsert")
+        kept = Source.objects.create(title="Kept", doi="10.6/kept")
+        stale = Source.objects.create(title="Stale", doi="10.6/stale")
+        kept_link = ClaimSource.objects.create(claim=claim, source=kept, relevance_score=0.1, rank=3)
+        ClaimSource.objects.create(claim=claim, source=stale, rank=0)
+
+        ok = AdminDisputeDetailView()._update_claim_sources(claim, [
+            {"title": "Fresh", "doi": "10.6/fresh", "relevance_score": 0.9, "excerpt": "f"},
+            {"title": "Kept", "doi": "10.6/kept", "relevance_score": 0.8, "excerpt": "k"},
+        ])
+        self.assertTrue(ok)
+        links = list(ClaimSource.objects.filter(claim=claim).select_related("source").order_by("rank"))
+        self.assertEqual([link.source.doi for link in links], ["10.6/fresh", "10.6/kept"])
+        # Baris yang tetap relevan diperbarui di tempat, bukan dihapus lalu dibuat ulang
+        self.assertEqual(links[1].id, kept_link.id)
+        self.assertEqual((links[1].rank, links[1].relevance_score, links[1].excerpt), (1, 0.8, "k"))
+
     def test_admin_dispute_approve_manual_update_adds_evidence(self):
         from api.admin_views import AdminDisputeDetailView
         from api.models import Claim, Dispute, VerificationResult, Source
@@ -1303,12 +1744,29 @@ class DashboardErrorTests(TestCase):
         self.client = APIClient()
         self.staff = User.objects.create_user(username="staffdash", password="p", is_staff=True, is_superuser=False)
         self.client.force_authenticate(user=self.staff)
+        cache.clear()
 
     def test_admin_dashboard_error_path(self):
         url = reverse("admin-dashboard-stats")
-        with patch("api.admin_views.Claim.objects.count", side_effect=Exception("boom")):
+        with patch("api.admin_views.Claim.objects.aggregate", side_effect=Exception("boom")):
             resp = self.client.get(url)
         self.assertEqual(resp.status_code, 500)
+
+    def test_admin_dashboard_stats_cached_and_invalidated(self):
+        url = reverse("admin-dashboard-stats")
+        Claim.objects.create(text="Klaim pertama")
+        resp = self.client.get(url)
+        self.assertEqual(resp.json()["stats"]["total_claims"], 1)
+
+        # Cache hit: tidak ada query agregasi ulang
+        with patch("api.admin_views.Claim.objects.aggregate", side_effect=Exception("boom")):
+            resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+
+        # post_save menghapus cache
+        Claim.objects.create(text="Klaim kedua")
+        resp = self.client.get(url)
+        self.assertEqual(resp.json()["stats"]["total_claims"], 2)
 class ClaimListPaginationTests(TestCase):
     def setUp(self):
         self.client = APIClient()
@@ -1336,6 +1794,7 @@ class AdminSourceListViewTests(TestCase):
             is_superuser=True,
         )
         self.client.force_authenticate(user=self.admin)
+        cache.clear()
 
     def test_source_list_search_and_pagination(self):
         from api.models import Source
@@ -1349,11 +1808,91 @@ class AdminSourceListViewTests(TestCase):
         self.assertEqual(data["pagination"]["page"], 1)
         self.assertTrue(data["pagination"]["total"] >= 5)
 
+        # Halaman terakhir (tidak penuh): total dihitung dari offset
+        resp = self.client.get(reverse("admin-source-list") + "?search=Title&page=3&per_page=2")
+        data = resp.json()
+        self.assertEqual(len(data["sources"]), 1)
+        self.assertEqual(data["pagination"]["total"], 5)
+        self.assertEqual(data["pagination"]["total_pages"], 3)
+
+    def test_source_list_cursor_pagination(self):
+        from urllib.parse import urlencode
+        from api.models import Source
+        created = [
+            Source.objects.create(title=f"Title {i}", url=f"https://example.com/{i}", credibility_score=0.5)
+            for i in range(5)
+        ]
+        # created_at sama -> id yang memutus urutan
+        Source.objects.filter(id__in=[s.id for s in created[:3]]).update(created_at=created[0].created_at)
+
+        base = reverse("admin-source-list")
+        resp = self.client.get(base + "?cursor=&per_page=2")
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()
+        seen = [row["id"] for row in data["sources"]]
+        self.assertTrue(data["pagination"]["has_next"])
+
+        while data["pagination"]["has_next"]:
+            query = urlencode({
+                "cursor": data["pagination"]["next_cursor"],
+                "cursor_id": data["pagination"]["next_cursor_id"],
+                "per_page": 2,
+            })
+            data = self.client.get(f"{base}?{query}").json()
+            seen += [row["id"] for row in data["sources"]]
+
+        expected = list(Source.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+        self.assertEqual(seen, expected)
+        self.assertIsNone(data["pagination"]["next_cursor"])
+
+        resp = self.client.get(base + "?cursor=not-a-date&cursor_id=1")
+        self.assertEqual(resp.status_code, 400)
+
+    def test_source_stats_derived_from_group_by(self):
+        from api.admin_views import AdminSourceStatsView
+        from api.models import Source
+        Source.objects.create(title="A", url="https://a.com", credibility_score=0.4, source_type="journal")
+        Source.objects.create(title="B", url="https://b.com", credibility_score=0.8, source_type="journal")
+        Source.objects.create(title="C", url="https://c.com", credibility_score=0.6, source_type="news")
+
+        # GROUP BY source_type + recent sources
+        with self.assertNumQueries(2):
+            stats = AdminSourceStatsView()._compute_stats()
+        self.assertEqual(stats["total_sources"], 3)
+        self.assertAlmostEqual(stats["avg_credibility"], 0.6)
+        self.assertEqual(stats["sources_by_type"][0], {"source_type": "journal", "count": 2})
+        self.assertEqual(len(stats["recent_sources"]), 3)
+
+        Source.objects.all().delete()
+        empty = AdminSourceStatsView()._compute_stats()
+        self.assertEqual(empty["total_sources"], 0)
+        self.assertEqual(empty["avg_credibility"], 0.0)
+
+    def test_source_list_conditional_get(self):
+        from api.models import Source
+        src = Source.objects.create(title="Title 0", url="https://example.com/0", credibility_score=0.5)
+        url = reverse("admin-source-list")
+
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+        etag = resp["ETag"]
+
+        # Tabel tidak berubah -> 304 dari ETag yang di-cache, tanpa query
+        with self.assertNumQueries(0):
+            resp = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 304)
+
+        # Delete tidak menaikkan MAX(updated_at), tapi COUNT berubah
+        src.delete()
+        resp = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 200)
+
     def test_source_list_error_path(self):
         url = reverse("admin-source-list")
         with patch("api.admin_views.Source.objects.all", side_effect=Exception("boom")):
             resp = self.client.get(url)
         self.assertEqual(resp.status_code, 500)
+        self.assertFalse(resp.has_header("ETag"))
 
     def test_source_detail_get_and_error_paths(self):
         from api.models import Source
@@ -1386,6 +1925,25 @@ class AdminSourceListViewTests(TestCase):
             resp_err = self.client.put(detail_url, data={"credibility_score": 0.7}, format="json")
         self.assertEqual(resp_err.status_code, 500)
 
+    def test_source_put_writes_only_editable_columns(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from api.models import Source
+        src = Source.objects.create(title="S1", url="https://example.com/1", doi="10.1/x", credibility_score=0.5)
+        detail_url = reverse("admin-source-detail", kwargs={"source_id": src.id})
+
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.put(detail_url, data={"title": "S1 baru", "credibility_score": 0.7}, format="json")
+        self.assertEqual(resp.status_code, 200)
+
+        update_sql = next(q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE"))
+        self.assertIn('"title"', update_sql)
+        self.assertNotIn('"doi"', update_sql)
+        src.refresh_from_db()
+        self.assertEqual(src.title, "S1 baru")
+        self.assertEqual(src.credibility_score, 0.7)
+        self.assertEqual(src.doi, "10.1/x")
+
     def test_source_delete_paths(self):
         from api.models import Source
         src = Source.objects.create(title="S1", url="https://example.com/1", credibility_score=0.5)
@@ -1407,7 +1965,10 @@ class AiAdapterUnitTests(TestCase):
         from api import ai_adapter
 
         class DummyModule:
+            calls = []
+
             def verify_claim_local(self, claim, **kwargs):
+                self.calls.append(kwargs)
                 return {
                     "_frontend_payload": {
                         "label": "verified",
@@ -1418,10 +1979,49 @@ class AiAdapterUnitTests(TestCase):
                 }
 
         with patch("api.ai_adapter.get_optimized_module", return_value=DummyModule()):
-            result = ai_adapter.call_ai_verify_direct_optimized("Klaim contoh")
+            raw = ai_adapter.call_ai_verify_direct_optimized("Klaim contoh")
+        # Payload mentah; normalisasi hanya di normalize_ai_response
+        self.assertEqual(raw["label"], "verified")
+        self.assertEqual(raw["sources"], [{"doi": "10.1/x", "relevance_score": 0.9}])
+        # In-process: payload dipakai dari return value, tanpa print [JSON_OUTPUT]
+        self.assertIs(DummyModule.calls[0]["emit_json"], False)
+
+        with (
+            patch("api.ai_adapter.get_optimized_module", return_value=DummyModule()),
+            patch("api.ai_adapter.training_modules_available", return_value=True),
+            patch.object(ai_adapter, "VERIFY_SCRIPT") as script,
+            patch("api.ai_adapter.extract_sources", wraps=ai_adapter.extract_sources) as extract,
+        ):
+            script.exists.return_value = True
+            result = ai_adapter.call_ai_verify("Vitamin C membantu sistem imun")
+        extract.assert_called_once()
         self.assertEqual(result["label"], "valid")
         self.assertGreaterEqual(result["confidence"], 0.75)
-        self.assertTrue(result["sources"])
+        self.assertEqual(result["sources"][0]["url"], "https://doi.org/10.1/x")
+
+    def test_get_optimized_module_does_not_retry_failed_import(self):
+        import builtins
+        from api import ai_adapter
+
+        real_import = builtins.__import__
+        attempts = []
+
+        def failing_import(name, *args, **kwargs):
+            if name == "prompt_and_verify":
+                attempts.append(name)
+                raise ImportError("no module")
+            return real_import(name, *args, **kwargs)
+
+        with (
+            patch.object(ai_adapter, "_optimized_module", None),
+            patch.object(ai_adapter, "_optimized_module_error", None),
+            patch("api.ai_adapter.training_modules_available", return_value=True),
+            patch("builtins.__import__", side_effect=failing_import),
+        ):
+            for _ in range(3):
+                with self.assertRaises(ImportError):
+                    ai_adapter.get_optimized_module()
+        self.assertEqual(attempts, ["prompt_and_verify"])
 
     def test_call_ai_verify_with_evidence_path(self):
         from api import ai_adapter
@@ -1435,6 +2035,36 @@ class AiAdapterUnitTests(TestCase):
             raw = ai_adapter.call_ai_verify_with_evidence("klaim", evidence)
         self.assertTrue(raw["sources"])
 
+    def test_call_ai_direct_reuses_gemini_client(self):
+        import os
+        from unittest.mock import MagicMock
+        from api import ai_adapter
+
+        client = MagicMock()
+        client.models.generate_content.return_value.text = '{"label": "valid", "confidence": 0.9}'
+        with (
+            patch.dict(os.environ, {"GEMINI_API_KEY": "k1"}),
+            patch.object(ai_adapter, "_gemini_client_entry", None),
+            patch("google.genai.Client", return_value=client) as mocked_cls,
+        ):
+            ai_adapter.call_ai_direct("klaim satu")
+            result = ai_adapter.call_ai_direct("klaim dua")
+            self.assertEqual(mocked_cls.call_count, 1)
+
+            # Ganti API key -> client dibuat ulang
+            os.environ["GEMINI_API_KEY"] = "k2"
+            ai_adapter.call_ai_direct("klaim tiga")
+            self.assertEqual(mocked_cls.call_count, 2)
+
+            # views memakai helper yang sama -> tidak ada client kedua
+            from api import views
+            self.assertIs(views.get_gemini_client(), client)
+            self.assertEqual(mocked_cls.call_count, 2)
+
+            del os.environ["GEMINI_API_KEY"]
+            self.assertIsNone(ai_adapter.get_gemini_client())
+        self.assertEqual(result["label"], "valid")
+
     def test_safe_float_and_parse_json(self):
         from api.ai_adapter import safe_float, parse_json_from_output
 
@@ -1445,6 +2075,23 @@ class AiAdapterUnitTests(TestCase):
         self.assertEqual(parse_json_from_output("xxx {\"a\": 2} yyy")["a"], 2)
         self.assertEqual(parse_json_from_output("[{\"a\": 3}]")["a"], 3)
 
+    def test_parse_json_nested_object_in_noise_and_health_patterns(self):
+        from api.ai_adapter import parse_json_from_output, is_health_related_claim
+
+        parsed = parse_json_from_output('log {"label": "valid", "meta": {"k": 1}} end')
+        self.assertEqual(parsed["label"], "valid")
+        self.assertEqual(parsed["meta"]["k"], 1)
+
+        self.assertTrue(is_health_related_claim("Merokok menyebabkan KANKER paru"))
+        self.assertFalse(is_health_related_claim("Harga saham naik minggu ini"))
+
+    def test_strip_code_fence(self):
+        from api.ai_adapter import _strip_code_fence
+
+        self.assertEqual(_strip_code_fence('```json\n{"label": "valid"}\n```'), '{"label": "valid"}')
+        self.assertEqual(_strip_code_fence('```{"label": "hoax"}``` selesai'), '{"label": "hoax"}')
+        self.assertEqual(_strip_code_fence('{"label": "hoax"}'), '{"label": "hoax"}')
+
     def test_validate_url_branches(self):
         from api.ai_adapter import validate_url
 
@@ -1462,6 +2109,20 @@ class AiAdapterUnitTests(TestCase):
         with patch("api.ai_adapter.requests.head", side_effect=Exception("x")):
             self.assertEqual(validate_url("https://fallback"), "https://fallback")
 
+    def test_determine_label_skips_health_scan_without_journal(self):
+        from api import ai_adapter
+
+        with patch("api.ai_adapter.is_health_related_claim") as health:
+            label = ai_adapter.determine_verification_label(0.9, has_sources=True, has_journal=False, claim_text="Vitamin C")
+        self.assertEqual(label, "unverified")
+        health.assert_not_called()
+
+        for confidence, expected in ((0.75, "valid"), (0.6, "uncertain"), (0.5, "hoax")):
+            self.assertEqual(
+                ai_adapter.determine_verification_label(confidence, has_journal=True, claim_text="Vitamin C untuk imun"),
+                expected,
+            )
+
     def test_normalize_ai_response_hoax_and_valid_paths(self):
         from api.ai_adapter import normalize_ai_response
 
@@ -1499,6 +2160,47 @@ class AiAdapterUnitTests(TestCase):
         self.assertEqual(sources[0]["doi"], "10.1/b")
         self.assertTrue(sources[0]["url"].startswith("https://doi.org/"))
 
+        sources = extract_sources(
+            {"sources": [{"doi": "10.1/hi", "relevance_score": 7}, {"doi": "10.1/lo", "relevance": -0.3}]}
+        )
+        self.assertEqual([s["relevance_score"] for s in sources], [1.0, 0.0])
+
+        long_text = "\n  " + "kata " * 400 + "\n"
+        sources = extract_sources({"sources": [{"doi": "10.1/long", "text": long_text}]})
+        self.assertEqual(sources[0]["excerpt"], long_text.strip()[:500])
+        self.assertEqual(sources[0]["title"], long_text.strip()[:80] + "...")
+
+        sources = extract_sources({"sources": [{"doi": f"10.1/{i}", "relevance_score": i / 10} for i in range(7)]})
+        self.assertEqual([s["doi"] for s in sources], ["10.1/6", "10.1/5", "10.1/4", "10.1/3", "10.1/2"])
+
+    def test_extract_sources_validates_each_url_once(self):
+        from api.ai_adapter import extract_sources
+
+        def fake_validate(url, timeout=3.0):
+            return "" if "dead" in url else url + "/final"
+
+        with patch("api.ai_adapter.validate_url", side_effect=fake_validate) as mocked_validate:
+            sources = extract_sources(
+                {
+                    "sources": [
+                        {"url": "https://a", "relevance_score": 0.3},
+                        {"url": "https://dead", "relevance_score": 0.9},
+                        {"url": "https://a", "title": "dup", "relevance_score": 0.2},
+                        {"doi": "10.1/c", "url": "https://skip", "relevance_score": 0.5},
+                        {"doi": " 10.1/c ", "relevance_score": 0.8},
+                    ]
+                }
+            )
+        self.assertEqual(sorted(c.args[0] for c in mocked_validate.call_args_list), ["https://a", "https://dead"])
+        # Duplikat (URL / DOI sama) hanya muncul sekali, entri pertama yang dipakai
+        self.assertEqual([s["url"] for s in sources], ["https://doi.org/10.1/c", "https://a/final"])
+        self.assertEqual(sources[0]["relevance_score"], 0.5)
+
+        # URL mati tapi punya safe_id -> tetap dipakai, url dikosongkan
+        with patch("api.ai_adapter.validate_url", return_value=""):
+            sources = extract_sources({"sources": [{"url": "https://dead", "safe_id": "doc-1"}]})
+        self.assertEqual([(s["title"], s["url"]) for s in sources], [("doc-1", "")])
+
 
 class EmailServiceExtendedTests(TestCase):
     @override_settings(ENABLE_EMAIL_NOTIFICATIONS=True, DEFAULT_FROM_EMAIL="noreply@example.com")
@@ -1637,13 +2339,17 @@ class AdminPipelineAndJournalsTests(TestCase):
         def dummy_fetch_doi(doi):
             return {"doi": doi, "title": "T", "abstract": "A", "url": f"https://doi.org/{doi}"}
 
+        from api.admin_views import fetch_similar_journals_task
+
         with (
             patch("api.admin_views.fetch_evidence_from_doi", side_effect=dummy_fetch_doi),
             patch("api.admin_views.call_ai_verify", return_value={"label": "valid", "confidence": 0.8, "summary": "x"}),
+            patch("api.admin_views.run_in_background") as mocked_bg,
         ):
             view = AdminDisputeDetailView()
             ok = view._trigger_pipeline(dispute)
         self.assertTrue(ok)
+        mocked_bg.assert_called_once_with(fetch_similar_journals_task, claim.id)
 
         class DummyPaper:
             def __init__(self, url, title="Title"):
@@ -1655,8 +2361,8 @@ class AdminPipelineAndJournalsTests(TestCase):
         def dummy_search(query, limit=2):
             return [DummyPaper("https://example.com/a"), DummyPaper("https://example.com/b")]
 
-        with patch("api.admin_views.SemanticScholar") as mocked_sem:
-            mocked_sem.return_value.search_paper = dummy_search
+        with patch("api.admin_views._SEMANTIC_SCHOLAR") as mocked_sem:
+            mocked_sem.search_paper = dummy_search
             ok2 = view._fetch_similar_journals(claim)
         self.assertTrue(ok2)
 
@@ -1670,7 +2376,35 @@ class AdminPipelineAndJournalsTests(TestCase):
 
         # text cukup panjang tapi SemanticScholar mengembalikan None
         claim2 = Claim.objects.create(text="Klaim panjang tentang kesehatan dan penelitian cukup untuk test")
-        with patch("api.admin_views.SemanticScholar") as mocked_sem:
-            mocked_sem.return_value.search_paper.return_value = None
+        with patch("api.admin_views._SEMANTIC_SCHOLAR") as mocked_sem:
+            mocked_sem.search_paper.return_value = None
             ok_none = view._fetch_similar_journals(claim2)
         self.assertFalse(ok_none)
+
+    def test_fetch_similar_journals_retries_on_rate_limit(self):
+        from api.admin_views import AdminDisputeDetailView
+        claim = Claim.objects.create(text="Klaim panjang tentang kesehatan untuk retry rate limit")
+        view = AdminDisputeDetailView()
+        with patch("api.admin_views._SEMANTIC_SCHOLAR") as mocked_sem, \
+                patch("api.admin_views.time.sleep") as mocked_sleep:
+            mocked_sem.search_paper.side_effect = [
+                ConnectionRefusedError("HTTP status 429 Too Many Requests."),
+                [],
+            ]
+            ok = view._fetch_similar_journals(claim)
+        self.assertFalse(ok)
+        self.assertEqual(mocked_sem.search_paper.call_count, 2)
+        self.assertEqual(mocked_sleep.call_count, 1)
+
+    def test_fetch_similar_journals_retries_on_httpx_timeout(self):
+        import httpx
+        from api.admin_views import AdminDisputeDetailView
+        claim = Claim.objects.create(text="Klaim panjang tentang kesehatan untuk retry timeout")
+        view = AdminDisputeDetailView()
+        with patch("api.admin_views._SEMANTIC_SCHOLAR") as mocked_sem, \
+                patch("api.admin_views.time.sleep") as mocked_sleep:
+            mocked_sem.search_paper.side_effect = httpx.ReadTimeout("timeout")
+            ok = view._fetch_similar_journals(claim, max_retries=2)
+        self.assertFalse(ok)
+        self.assertEqual(mocked_sem.search_paper.call_count, 2)
+        self.assertEqual(mocked_sleep.call_count, 1)
@@ -29,6 +29,7 @@ from .admin_views import (
     AdminUserDetailView,
     AdminDisputeListView,
     AdminDisputeDetailView,
+    AdminJobStatusView,
     AdminSourceListView,
     AdminSourceDetailView,
     AdminSourceStatsView
@@ -63,6 +64,7 @@ urlpatterns = [
     path('admin/disputes/', AdminDisputeListView.as_view(), name='admin-dispute-list'),
     path('admin/disputes/<int:dispute_id>/', AdminDisputeDetailView.as_view(), name='admin-dispute-detail'),
     path('admin/disputes/<int:dispute_id>/action/', AdminDisputeDetailView.as_view(), name='admin-dispute-action'),
+    path('admin/jobs/<str:job_id>/', AdminJobStatusView.as_view(), name='admin-job-status'),
 
     # Admin Sources
     path('admin/sources/', AdminSourceListView.as_view(), name='admin-source-list'),
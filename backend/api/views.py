@@ -1,8 +1,6 @@
 import logging
 import hashlib
 import re
-import os
-from google import genai
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
@@ -14,7 +12,7 @@ from .permissions import IsAdminOrReadOnly
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.db import transaction, models, connection
-from django.db.models import Q
+from django.db.models import Case, F, IntegerField, Q, Value, When
 from django.http import Http404
 from django.conf import settings
 from django.core.cache import cache
@@ -35,29 +33,13 @@ from .text_normalization import (
     normalize_claim_text
 )
 from . import text_normalization as text_norm
-from .ai_adapter import call_ai_verify
+from .ai_adapter import call_ai_verify, get_gemini_client
 from .email_service import email_service
+from .tasks import enqueue_on_commit
 
 logger = logging.getLogger(__name__)
 
-_gemini_client = None
-
 # Utility Functions 
-def get_gemini_client():
-    """Get Gemini client, returns None if API key not available."""
-    global _gemini_client
-    if _gemini_client is None:
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            logger.warning("GEMINI_API_KEY not found - Gemini features disabled")
-            return None
-        try:
-            _gemini_client = genai.Client(api_key=api_key)
-        except Exception as e:
-            logger.error(f"Failed to initialize Gemini client: {e}")
-            return None
-    return _gemini_client
-
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def health_check(request):
@@ -72,7 +54,7 @@ def health_check(request):
         'status': 'healthy',
         'django_version': django.get_version(),
         'database': db_status,
-        'timestamp': timezone.now().isoformat()
+        'timestamp': timezone.now()
     }, status=200)
     
 def normalize_claim_text(text: str) -> str:
@@ -143,48 +125,37 @@ def check_cached_result(claim_text: str):
         # Normalisasi teks klaim menggunakan text_normalization (konsisten dengan model Claim)
         normalized = text_norm.normalize_claim_text(claim_text)
 
-        # Ambil semua klaim dengan teks ternormalisasi yang sama dan status DONE
-        # beserta VerificationResult-nya (jika ada).
-        claims_qs = (
+        # Satu query: klaim DONE dengan teks ternormalisasi sama yang punya VerificationResult.
+        # Urutan: label BUKAN 'unverified' dulu, lalu verification_result.updated_at terbaru.
+        claim = (
             Claim.objects
-            .filter(text_normalized=normalized, status=Claim.STATUS_DONE)
+            .filter(
+                text_normalized=normalized,
+                status=Claim.STATUS_DONE,
+                verification_result__isnull=False,
+            )
             .select_related('verification_result')
+            .annotate(
+                is_unverified=Case(
+                    When(verification_result__label=VerificationResult.LABEL_UNVERIFIED, then=Value(1)),
+                    default=Value(0),
+                    output_field=IntegerField(),
+                )
+            )
+            .order_by('is_unverified', '-verification_result__updated_at', '-updated_at')
+            .first()
         )
 
-        if not claims_qs.exists():
+        if claim is None:
             logger.info("[CACHE MISS] Claim tidak ditemukan di cache.")
             return False, None, None
 
-        # 1) Prioritaskan klaim yang punya VerificationResult dan label BUKAN 'unverified',
-        # diurutkan dari verification_result.updated_at paling baru.
-        prioritized_claims = list(
-            claims_qs
-            .filter(verification_result__isnull=False)
-            .order_by('-verification_result__updated_at', '-updated_at')
+        vr = claim.verification_result
+        logger.info(
+            f"[CACHE HIT] Using result for claim ID: {claim.id} "
+            f"(label={vr.label}, updated_at={vr.updated_at})"
         )
-
-        for claim in prioritized_claims:
-            vr = getattr(claim, 'verification_result', None)
-            if vr and vr.label != VerificationResult.LABEL_UNVERIFIED:
-                logger.info(
-                    f"[CACHE HIT] Using non-unverified result for claim ID: {claim.id} "
-                    f"(label={vr.label}, updated_at={vr.updated_at})"
-                )
-                return True, claim, vr
-
-        # 2) Jika tidak ada yang non-unverified, tapi ada VerificationResult, gunakan yang terbaru.
-        if prioritized_claims:
-            claim = prioritized_claims[0]
-            vr = claim.verification_result
-            logger.info(
-                f"[CACHE HIT] Using latest available result for claim ID: {claim.id} "
-                f"(label={vr.label}, updated_at={vr.updated_at})"
-            )
-            return True, claim, vr
-
-        # 3) Tidak ada VerificationResult sama sekali untuk klaim-klaim ini
-        logger.info("[CACHE MISS] Claim ditemukan tetapi belum memiliki hasil verifikasi.")
-        return False, None, None
+        return True, claim, vr
 
     except Exception as e:
         logger.error(f"[CACHE ERROR] Terjadi kesalahan saat mengecek cache: {str(e)}", exc_info=True)
@@ -400,6 +371,7 @@ class ClaimVerifyView(APIView):
     """Main endpoint untuk verifikasi klaim."""
 
     SIMILARITY_THRESHOLD = 0.90
+    VALID_LABELS = frozenset(label for label, _ in VerificationResult.LABEL_CHOICES)
 
     def post(self, request):
         """Terima klaim baru dan jalankan verifikasi AI (tanpa cache)."""
@@ -467,8 +439,7 @@ class ClaimVerifyView(APIView):
         summary = ai_result.get("summary", "")
         label = ai_result.get("label", "unverified")
 
-        valid_labels = ["valid", "hoax", "uncertain", "unverified"]
-        if label not in valid_labels:
+        if label not in self.VALID_LABELS:
             logger.warning(
                 f"[VERIFY] Invalid label '{label}' dari AI, fallback ke 'unverified'"
             )
@@ -818,8 +789,8 @@ class ClaimListView(APIView):
             'id': claim.id,
             'text': claim.text,
             'status': claim.status,
-            'created_at': claim.created_at.isoformat(),
-            'updated_at': claim.updated_at.isoformat(),
+            'created_at': claim.created_at,
+            'updated_at': claim.updated_at,
         }
         
         # Add verification result if exists
@@ -847,8 +818,8 @@ class ClaimListView(APIView):
             'confidence': round(vr.confidence, 4) if vr.confidence is not None else None,
             'confidence_percent': vr.confidence_percent(),
             'summary': vr.summary,
-            'verification_created_at': vr.created_at.isoformat(),
-            'verification_updated_at': vr.updated_at.isoformat()
+            'verification_created_at': vr.created_at,
+            'verification_updated_at': vr.updated_at
         }
     
     def _get_default_verification(self):
@@ -891,6 +862,20 @@ class ClaimListView(APIView):
         }
 
 # Dispute Views
+def send_new_dispute_notification(dispute_id: int) -> bool:
+    """
+    Task background: kirim email dispute baru ke admin.
+    Dijadwalkan via enqueue_on_commit sehingga response create tidak menunggu SMTP.
+    """
+    try:
+        dispute = Dispute.objects.get(id=dispute_id)
+    except Dispute.DoesNotExist:
+        logger.warning(f"[EMAIL] Dispute {dispute_id} not found, skipping admin notification")
+        return False
+
+    return email_service.notify_admin_new_dispute(dispute)
+
+
 class DisputeCreateView(APIView):
     """POST endpoint untuk membuat dispute baru"""
     
@@ -907,11 +892,17 @@ class DisputeCreateView(APIView):
         
         # Auto-link dispute ke claim jika ada
         claim = None
+        # Label/confidence verifikasi ikut di-JOIN sebagai kolom (None jika belum ada),
+        # tanpa akses descriptor verification_result yang memicu SELECT kedua
+        claims_with_verification = Claim.objects.annotate(
+            verification_label=F('verification_result__label'),
+            verification_confidence=F('verification_result__confidence')
+        )
         
         if claim_id:
             # Explicit claim_id provided
             try:
-                claim = Claim.objects.get(id=claim_id)
+                claim = claims_with_verification.get(id=claim_id)
                 logger.info(f"[DISPUTE CREATE] Using explicit claim_id: {claim_id}")
             except Claim.DoesNotExist:
                 logger.warning(f"[DISPUTE CREATE] Claim {claim_id} not found, will create without link")
@@ -924,7 +915,11 @@ class DisputeCreateView(APIView):
                 normalized_input = normalize_claim_text(claim_text)
                 
                 # Find all claims dengan similarity >= 0.85
-                all_claims = Claim.objects.filter(status=Claim.STATUS_DONE).values_list('id', 'text')
+                # iterator(): baris di-stream per chunk (server-side cursor di PostgreSQL)
+                # sehingga seluruh teks klaim tidak dimuat ke memori sekaligus
+                all_claims = Claim.objects.filter(
+                    status=Claim.STATUS_DONE
+                ).values_list('id', 'text').iterator(chunk_size=500)
                 
                 best_match = None
                 best_similarity = 0.0
@@ -937,7 +932,7 @@ class DisputeCreateView(APIView):
                 
                 # AUTO-LINK jika similarity >= 0.80
                 if best_match and best_similarity >= 0.80:
-                    claim = Claim.objects.get(id=best_match)
+                    claim = claims_with_verification.get(id=best_match)
                     logger.info(
                         f"[DISPUTE CREATE] Auto-linked to Claim {best_match} "
                         f"(similarity: {best_similarity:.2%})"
@@ -955,10 +950,9 @@ class DisputeCreateView(APIView):
         original_label = None
         original_confidence = None
         
-        if claim and hasattr(claim, 'verification_result'):
-            vr = claim.verification_result
-            original_label = vr.label
-            original_confidence = vr.confidence
+        if claim and claim.verification_label is not None:
+            original_label = claim.verification_label
+            original_confidence = claim.verification_confidence
             logger.info(
                 f"[DISPUTE CREATE] Storing original verification: "
                 f"label={original_label}, confidence={original_confidence}"
@@ -981,11 +975,8 @@ class DisputeCreateView(APIView):
             
             logger.info(f"[DISPUTE CREATE] Created dispute ID: {dispute.id}")
             
-            # Send admin notification
-            try:
-                email_service.notify_admin_new_dispute(dispute)
-            except Exception as e:
-                logger.error(f"[DISPUTE CREATE] Failed to send admin notification: {e}")
+            # Notifikasi admin dikirim di background setelah commit (tanpa menunggu SMTP)
+            enqueue_on_commit(send_new_dispute_notification, dispute.id)
             
             return Response(
                 {
@@ -1010,20 +1001,22 @@ class DisputeListView(APIView):
         logger.info("[DISPUTE_LIST] Fetching disputes list")
 
         try:
-            disputes = Dispute.objects.select_related('claim').order_by('-created_at')[:50]
+            # Hanya kolom Dispute yang dipakai; relasi claim tidak dibaca, jadi tanpa JOIN
+            disputes = Dispute.objects.only(
+                'id', 'claim_text', 'status', 'created_at'
+            ).order_by('-created_at')[:50]
             
-            dispute_list = []
-            for dispute in disputes:
-                dispute_list.append({
-                    'id': dispute.id,
-                    'claim_text': dispute.claim_text[:100],
-                    'status': dispute.status,
-                    'created_at': dispute.created_at.isoformat()
-                })
+            dispute_list = [{
+                'id': dispute.id,
+                'claim_text': dispute.claim_text[:100],
+                'status': dispute.status,
+                'created_at': dispute.created_at
+            } for dispute in disputes]
             
+            # Total dari list yang sudah dimuat, bukan SELECT COUNT terpisah
             return Response({
                 'disputes': dispute_list,
-                'total': disputes.count()
+                'total': len(dispute_list)
             }, status=status.HTTP_200_OK)
 
         except Exception as e:
@@ -1112,7 +1105,9 @@ class AdminJournalListView(APIView):
         page = int(request.GET.get('page', 1))
         per_page = int(request.GET.get('per_page', 20))
 
-        journals = JournalArticle.objects.all()
+        # embedding (vektor serial, besar) tidak ditampilkan; created_by di-join
+        # agar created_by_name tidak memicu query per baris
+        journals = JournalArticle.objects.defer('embedding').select_related('created_by')
 
         if search:
             journals = journals.filter(
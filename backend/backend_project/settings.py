@@ -170,6 +170,26 @@ else:
             }
         }
 
+# Cache Configuration
+# Redis dibagi semua worker gunicorn (stats dashboard, status job, evidence);
+# tanpa REDIS_URL fallback ke cache lokal per proses untuk development
+REDIS_URL = os.getenv('REDIS_URL', '').strip()
+
+if REDIS_URL.startswith(('redis://', 'rediss://')):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'healthify',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -254,11 +274,21 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',  # Default untuk public endpoints
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'EXCEPTION_HANDLER': 'rest_framework.views.exception_handler',
 }
 
+# Background task worker pool (pipeline dispute, fetch evidence, dll)
+BACKGROUND_TASK_WORKERS = int(os.getenv('BACKGROUND_TASK_WORKERS', '4'))
+
+# Warm-up modul AI saat worker WSGI start (lihat backend_project/wsgi.py)
+AI_WARMUP_ON_STARTUP = os.getenv('AI_WARMUP_ON_STARTUP', 'True') == 'True'
+
 # JWT Settings
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=2),
@@ -14,3 +14,13 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend_project.settings')
 
 application = get_wsgi_application()
+
+# Muat modul verifikasi (import berat) sekali per worker di background,
+# supaya request verifikasi pertama tidak menanggung waktu import
+from django.conf import settings  # noqa: E402
+
+if settings.AI_WARMUP_ON_STARTUP:
+    from api.ai_adapter import warm_up_ai  # noqa: E402
+    from api.tasks import run_in_background  # noqa: E402
+
+    run_in_background(warm_up_ai)
@@ -511,6 +511,9 @@ def extract_xy_from_claim(claim: str) -> tuple[str, str]:
     return "", ""
 
 # Scoring relevansi yang dimodifikasi
+_CLAIM_TOKEN_RE = re.compile(r"[A-Za-z0-9À-ÿ]{3,}")
+_WHITESPACE_RE = re.compile(r"\s")
+
 def compute_relevance_score(claim: str, neighbor_text: str, neighbor_title: str = "") -> float:
     """
     Hitung skor relevansi menggunakan pola hasil LLM.
@@ -537,7 +540,8 @@ def compute_relevance_score(claim: str, neighbor_text: str, neighbor_title: str
     hit_count = 0
     for p in patterns:
         # pemeriksaan word boundary untuk token pendek untuk menghindari kecocokan substring yang tidak disengaja
-        if len(p.split()) == 1:
+        # Satu kata (p sudah di-strip): cukup cek tidak ada whitespace, tanpa split() per pola
+        if p and _WHITESPACE_RE.search(p) is None:
             if re.search(r'\b' + re.escape(p) + r'\b', text_lower):
                 hit_count += 1
         else:
@@ -547,7 +551,8 @@ def compute_relevance_score(claim: str, neighbor_text: str, neighbor_title: str
     score = hit_count / max(len(patterns), 1)
 
     # Soft cap & smoothing: jika sangat sedikit pola yang cocok tapi teks berisi token klaim, tingkatkan sedikit
-    if score < 0.2 and any(tok for tok in re.findall(r"[A-Za-z0-9À-ÿ]{3,}", claim_lower) if tok in text_lower):
+    # finditer: berhenti di token pertama yang cocok tanpa membangun list semua token
+    if score < 0.2 and any(m.group(0) in text_lower for m in _CLAIM_TOKEN_RE.finditer(claim_lower)):
         score = min(score + 0.15, 1.0)
 
     try:
@@ -581,7 +586,8 @@ def compute_relevance_score(claim: str, neighbor_text: str, neighbor_title: str
             # Tidak jelas menyebut X maupun Y spesifik -> biarkan skor apa adanya
             pass
 
-    return float(max(0.0, min(1.0, score)))
+    score = float(score)
+    return 0.0 if score < 0.0 else 1.0 if score > 1.0 else score
 
 
 # Fungsi retrieval dan filtering
@@ -1502,6 +1508,18 @@ def extract_json_from_text(text: str) -> Dict[str, Any]:
     print("[PERINGATAN] Tidak dapat mem-parse JSON dari LLM. Mengembalikan response HOAX default.")
     return validate_and_normalize_result({})
 
+# Sinonim label dari LLM -> label kanonik (dibangun sekali per proses)
+_CANONICAL_LABELS = frozenset({"VALID", "HOAX", "PARTIALLY_VALID"})
+_LLM_LABEL_MAPPING = {
+    "TRUE": "VALID", "BENAR": "VALID",
+    "FALSE": "HOAX", "SALAH": "HOAX",
+    "PARTIAL": "PARTIALLY_VALID", "SEBAGIAN": "PARTIALLY_VALID",
+    "PARTIALLY_TRUE": "PARTIALLY_VALID", "SEBAGIAN_BENAR": "PARTIALLY_VALID",
+    "CONDITIONAL": "PARTIALLY_VALID", "KONDISIONAL": "PARTIALLY_VALID",
+    "CONTEXT_DEPENDENT": "PARTIALLY_VALID",
+    "UNCERTAIN": "PARTIALLY_VALID", "TIDAK_PASTI": "PARTIALLY_VALID"
+}
+
 def validate_and_normalize_result(result: dict) -> dict:
     """Validasi dan normalisasi result dari LLM ke format yang konsisten."""
     result = result or {}
@@ -1511,17 +1529,8 @@ def validate_and_normalize_result(result: dict) -> dict:
         result["label"] = "HOAX"
     
     label = safe_strip(result.get("label", "")).upper()
-    if label not in ["VALID", "HOAX", "PARTIALLY_VALID"]:
-        label_mapping = {
-            "TRUE": "VALID", "BENAR": "VALID",
-            "FALSE": "HOAX", "SALAH": "HOAX",
-            "PARTIAL": "PARTIALLY_VALID", "SEBAGIAN": "PARTIALLY_VALID",
-            "PARTIALLY_TRUE": "PARTIALLY_VALID", "SEBAGIAN_BENAR": "PARTIALLY_VALID",
-            "CONDITIONAL": "PARTIALLY_VALID", "KONDISIONAL": "PARTIALLY_VALID",
-            "CONTEXT_DEPENDENT": "PARTIALLY_VALID",
-            "UNCERTAIN": "PARTIALLY_VALID", "TIDAK_PASTI": "PARTIALLY_VALID"
-        }
-        result["label"] = label_mapping.get(label, "HOAX")
+    if label not in _CANONICAL_LABELS:
+        result["label"] = _LLM_LABEL_MAPPING.get(label, "HOAX")
     else:
         result["label"] = label
     
@@ -1662,7 +1671,8 @@ def verify_claim_local(claim: str, k: int = 5, dry_run: bool = False,
                       enable_expansion: bool = True, min_relevance: float = 0.25,
                       force_dynamic_fetch: bool = False, 
                       debug_retrieval: bool = False,
-                      use_cache: bool = True) -> Dict[str, Any]:
+                      use_cache: bool = True,
+                      emit_json: bool = True) -> Dict[str, Any]:
     """
     MODIFIED: Database-first verification flow with caching.
     
@@ -1672,6 +1682,9 @@ def verify_claim_local(claim: str, k: int = 5, dry_run: bool = False,
     3. Jika tidak ada hasil yang cukup relevan, baru fetch dari API
     4. Verifikasi dengan LLM
     5. Simpan hasil ke cache
+
+    emit_json=False melewati print blok [JSON_OUTPUT] ke stdout; dipakai pemanggil
+    in-process (backend) yang langsung memakai dict hasil return.
     """
     claim = safe_strip(claim)
     if not claim:
@@ -1757,8 +1770,9 @@ def verify_claim_local(claim: str, k: int = 5, dry_run: bool = False,
                 "references": [],
                 "metadata": {}
             }
-            print("\n[JSON_OUTPUT]")
-            print(json.dumps(frontend, ensure_ascii=False, indent=2))
+            if emit_json:
+                print("\n[JSON_OUTPUT]")
+                print(json.dumps(frontend, ensure_ascii=False, indent=2))
             return {"_frontend_payload": frontend}
 
         # Menerjemahkan snippets untuk LLM
@@ -1843,8 +1857,9 @@ def verify_claim_local(claim: str, k: int = 5, dry_run: bool = False,
             print(f"[SAVE_VERIF] Warning: gagal menyimpan payload: {e}", file=sys.stderr)
 
         # Print JSON output dan return
-        print("\n[JSON_OUTPUT]")
-        print(json.dumps(frontend, ensure_ascii=False, indent=2))
+        if emit_json:
+            print("\n[JSON_OUTPUT]")
+            print(json.dumps(frontend, ensure_ascii=False, indent=2))
         
         # Save to cache
         result = {"_frontend_payload": frontend}
@@ -1873,8 +1888,9 @@ def verify_claim_local(claim: str, k: int = 5, dry_run: bool = False,
             "references": [],
             "metadata": {"error": error_msg}
         }
-        print("\n[JSON_OUTPUT]")
-        print(json.dumps(error_frontend, ensure_ascii=False, indent=2))
+        if emit_json:
+            print("\n[JSON_OUTPUT]")
+            print(json.dumps(error_frontend, ensure_ascii=False, indent=2))
         return {"_frontend_payload": error_frontend}
 
 